@@ -8,15 +8,18 @@ If conversion fails or if the outputs in
 something is wrong with latest changes in the codebase.
 """
 
+import errno
+import http.client
 import json
-import os
 import shutil
 import sys
 import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-
-import urllib3
-from urllib3 import Timeout
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote
 
 try:
     from waldiez.exporter import WaldiezExporter
@@ -27,8 +30,11 @@ except ImportError:
 ROOT_DIR = Path(__file__).resolve().parents[1]
 DOT_LOCAL = ROOT_DIR / ".local"
 DOT_LOCAL.mkdir(exist_ok=True, parents=True)
+DOT_LOCAL_EXAMPLES = DOT_LOCAL / "examples"
+ETAGS_FILE = DOT_LOCAL / "etags.json"
 
-REPO_URL = "https://raw.githubusercontent.com/waldiez/examples/refs/heads/main"
+REPO_HOST = "raw.githubusercontent.com"
+REPO_PATH = "/waldiez/examples/refs/heads/main"
 EXAMPLES = [
     "01 - Standup Comedians/Standup Comedians 1.waldiez",
     "01 - Standup Comedians/Standup Comedians 2.waldiez",
@@ -50,66 +56,212 @@ EXAMPLES = [
     "13 - Captain/2 - With agent lib.waldiez",
     "13 - Captain/3 - With agent lib and tool lib.waldiez",
 ]
+MAX_WORKERS = 8
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_TIMEOUT = 30.0
+# all the examples are on the same host (and scheme),
+# so let's keep one (keep-alive) connection per worker thread
+_CONNECTIONS = threading.local()
+
+
+def _get_connection(reconnect: bool = False) -> http.client.HTTPSConnection:
+    """Get the current thread's connection to the examples host.
+
+    Parameters
+    ----------
+    reconnect : bool, optional
+        Whether to drop the existing connection and open a new one.
+
+    Returns
+    -------
+    http.client.HTTPSConnection
+        The connection.
+    """
+    connection: Optional[http.client.HTTPSConnection] = getattr(
+        _CONNECTIONS, "connection", None
+    )
+    if connection is not None and reconnect:
+        connection.close()
+        connection = None
+    if connection is None:
+        connection = http.client.HTTPSConnection(
+            REPO_HOST, timeout=DOWNLOAD_TIMEOUT
+        )
+        _CONNECTIONS.connection = connection
+    return connection
 
 
 def download_example(
-    pool: urllib3.PoolManager, example_url: str, example_path: str
-) -> None:
+    example_url: str,
+    example_path: Path,
+    cached_path: Path,
+    etag: Optional[str] = None,
+) -> Optional[str]:
     """Download an example from the git repo.
 
+    If we have a cached copy of the example (from a previous run)
+    and its ETag, a conditional request is made and the cached copy
+    is reused if the example has not changed.
+
     Parameters
     ----------
-    pool : urllib3.PoolManager
-        The pool manager.
     example_url : str
-        The URL of the example.
-    example_path : str
+        The URL path (on the repo's host) of the example.
+    example_path : Path
         The path to save the example.
+    cached_path : Path
+        The path of the previously downloaded example (if any).
+    etag : Optional[str], optional
+        The ETag of the previously downloaded example, by default None.
+
+    Returns
+    -------
+    Optional[str]
+        The ETag of the downloaded example (if any).
 
     Raises
     ------
     Exception
         If the download fails.
     """
-    response = pool.request("GET", example_url)
+    headers: Dict[str, str] = {}
+    if etag and cached_path.is_file():
+        headers["If-None-Match"] = etag
+    connection = _get_connection()
+    try:
+        connection.request("GET", example_url, headers=headers)
+        response = connection.getresponse()
+    except (http.client.HTTPException, ConnectionError):
+        # the kept-alive connection went stale, retry once
+        connection = _get_connection(reconnect=True)
+        connection.request("GET", example_url, headers=headers)
+        response = connection.getresponse()
+    try:
+        return _save_example(
+            response, example_url, example_path, cached_path, etag
+        )
+    finally:
+        # make sure the body is consumed so the connection can be reused
+        response.read()
+
+
+def _save_example(
+    response: http.client.HTTPResponse,
+    example_url: str,
+    example_path: Path,
+    cached_path: Path,
+    etag: Optional[str],
+) -> Optional[str]:
+    """Save a downloaded (or the cached, if not modified) example.
+
+    Parameters
+    ----------
+    response : http.client.HTTPResponse
+        The response of the example's request.
+    example_url : str
+        The URL path (on the repo's host) of the example.
+    example_path : Path
+        The path to save the example.
+    cached_path : Path
+        The path of the previously downloaded example (if any).
+    etag : Optional[str]
+        The ETag of the previously downloaded example.
+
+    Returns
+    -------
+    Optional[str]
+        The ETag of the saved example (if any).
+
+    Raises
+    ------
+    Exception
+        If the download failed.
+    """
+    if response.status == 304:
+        shutil.copyfile(cached_path, example_path)
+        return etag
     if response.status != 200:
         # pylint: disable=broad-exception-raised
         raise Exception(f"Failed to download {example_url}")
-    flow_data = json.loads(response.data.decode("utf-8"))
-    with open(example_path, "w", encoding="utf-8") as file:
-        json.dump(flow_data, file)
+    # no need to parse it here, WaldiezExporter.load will do it
+    with open(example_path, "wb") as file:
+        shutil.copyfileobj(response, file, length=DOWNLOAD_CHUNK_SIZE)
+    return response.getheader("ETag")
+
+
+def _load_etags() -> Dict[str, str]:
+    """Load the ETags of the previously downloaded examples.
+
+    Returns
+    -------
+    Dict[str, str]
+        The ETags by example.
+    """
+    try:
+        with open(ETAGS_FILE, "r", encoding="utf-8") as file:
+            etags = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    return etags if isinstance(etags, dict) else {}
+
+
+def _save_etags(etags: Dict[str, str]) -> None:
+    """Store the ETags of the downloaded examples.
+
+    Parameters
+    ----------
+    etags : Dict[str, str]
+        The ETags by example.
+    """
+    with open(ETAGS_FILE, "w", encoding="utf-8") as file:
+        json.dump(etags, file, indent=2)
+
+
+def _fast_move(src: Path, dst: Path) -> None:
+    """Move a file or directory, using a rename if on the same filesystem.
+
+    Parameters
+    ----------
+    src : Path
+        The source path.
+    dst : Path
+        The destination path.
+
+    Raises
+    ------
+    OSError
+        If the move fails for any other reason than a cross-device link.
+    """
+    try:
+        src.replace(dst)
+    except OSError as error:
+        if error.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
 
+def move_to_dot_local(example_dir: Path, temp_path: Path) -> None:
+    """Move the converted examples of a directory to the .local directory.
 
-def move_to_dot_local(
-    example_dir: str, example_path: str, flow_name: str
-) -> None:
-    """Move the converted example to the .local directory.
+    If the destination directory does not exist yet, the whole directory
+    (examples, generated .py and any api keys files) is moved at once,
+    otherwise its files are moved one by one, replacing existing ones.
 
     Parameters
     ----------
-    example_dir : str
-        The directory of the example.
-    example_path : str
-        The path to the example.
-    flow_name : str
-        The name of the flow.
+    example_dir : Path
+        The directory of the examples (relative to the examples root).
+    temp_path : Path
+        The (temporary) root of the converted examples.
     """
-    example_name = os.path.basename(example_path)
-    dot_local_dir = os.path.join(DOT_LOCAL, "examples", example_dir)
-    os.makedirs(dot_local_dir, exist_ok=True)
-    dot_local_path = os.path.join(dot_local_dir, example_name)
-    shutil.move(example_path, dot_local_path)
-    dot_local_py_path = dot_local_path.replace(".waldiez", ".py")
-    shutil.move(example_path.replace(".waldiez", ".py"), dot_local_py_path)
-    # check for {flow_name}_api_keys.py
-    flow_name_ = flow_name.replace(" ", "_").replace("-", "_").lower()
-    example_path_dir = os.path.dirname(example_path)
-    api_keys_path = os.path.join(example_path_dir, f"{flow_name_}_api_keys.py")
-    if os.path.exists(api_keys_path):
-        dst = os.path.join(dot_local_dir, f"{flow_name_}_api_keys.py")
-        if os.path.exists(dst):
-            os.remove(dst)
-        shutil.move(api_keys_path, dst)
+    src_dir = temp_path / example_dir
+    dst_dir = DOT_LOCAL_EXAMPLES / example_dir
+    if not dst_dir.exists():
+        dst_dir.parent.mkdir(parents=True, exist_ok=True)
+        _fast_move(src_dir, dst_dir)
+        return
+    for src in src_dir.iterdir():
+        _fast_move(src, dst_dir / src.name)
 
 
 def convert_examples() -> None:
@@ -120,25 +272,46 @@ def convert_examples() -> None:
     Exception
         If the conversion fails.
     """
-    temp_dir = tempfile.mkdtemp()
-    timeout = Timeout(connect=10.0, read=30.0)
-    pool = urllib3.PoolManager(timeout=timeout)
-    for example in EXAMPLES:
-        example_dir = os.path.dirname(example)
-        example_url = f"{REPO_URL}/{example}"
-        example_path = os.path.join(temp_dir, example)
-        os.makedirs(os.path.dirname(example_path), exist_ok=True)
-        print(f"Downloading {example} ...")
-        download_example(pool, example_url, example_path)
-        print(f"Converting {example} ...")
-        flow = WaldiezExporter.load(Path(example_path))
-        output_path = example_path.replace(".waldiez", ".py")
-        WaldiezExporter.export(flow, output_path)
-        if not os.path.exists(output_path):
-            # pylint: disable=broad-exception-raised
-            raise Exception(f"Failed to convert {example}")
-        move_to_dot_local(example_dir, example_path, flow.waldiez.name)
-    shutil.rmtree(temp_dir)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        # examples left to convert in each directory
+        pending = Counter(Path(example).parent for example in EXAMPLES)
+        for example_dir in pending:
+            (temp_path / example_dir).mkdir(parents=True, exist_ok=True)
+        etags = _load_etags()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures: Dict[Future[Optional[str]], Tuple[str, Path]] = {}
+            for example in EXAMPLES:
+                example_url = quote(f"{REPO_PATH}/{example}")
+                example_path = temp_path / example
+                print(f"Downloading {example} ...")
+                future = executor.submit(
+                    download_example,
+                    example_url,
+                    example_path,
+                    DOT_LOCAL_EXAMPLES / example,
+                    etags.get(example),
+                )
+                futures[future] = (example, example_path)
+            for future in as_completed(futures):
+                example, example_path = futures[future]
+                etag = future.result()
+                if etag:
+                    etags[example] = etag
+                else:
+                    etags.pop(example, None)
+                print(f"Converting {example} ...")
+                flow = WaldiezExporter.load(example_path)
+                output_path = example_path.with_suffix(".py")
+                WaldiezExporter.export(flow, output_path)
+                if not output_path.exists():
+                    # pylint: disable=broad-exception-raised
+                    raise Exception(f"Failed to convert {example}")
+                example_dir = example_path.parent.relative_to(temp_path)
+                pending[example_dir] -= 1
+                if pending[example_dir] == 0:
+                    move_to_dot_local(example_dir, temp_path)
+        _save_etags(etags)
 
 
 if __name__ == "__main__":
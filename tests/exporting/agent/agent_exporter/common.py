@@ -4,7 +4,7 @@
 # pylint: disable=too-many-locals,too-many-statements,line-too-long
 """Common functions for testing waldiez.exporting.agent.AgentExporter."""
 
-from typing import List, Tuple, Type
+from typing import Dict, List, Tuple, Type
 
 from waldiez.models import (
     WaldiezAgent,
@@ -19,6 +19,23 @@ from waldiez.models import (
     WaldiezUserProxy,
 )
 
+AGENT_CLASSES: Dict[WaldiezAgentType, Type[WaldiezAgent]] = {
+    "user": WaldiezUserProxy,
+    "assistant": WaldiezAssistant,
+    "rag_user": WaldiezRagUser,
+    "manager": WaldiezGroupManager,
+    "swarm": WaldiezSwarmAgent,
+    "reasoning": WaldiezReasoningAgent,
+}
+SKILL_CONTENT_TEMPLATE = (
+    "def skill{counter}_{index}():\n"
+    '    return "skill body of skill{counter}_{index}"'
+)
+SKILL1_SECRETS = {
+    "SECRET_KEY_1": "SECRET_VALUE_1",
+    "SECRET_KEY_2": "SECRET_VALUE_2",
+}
+
 
 def create_agent(
     counter: int,
@@ -38,17 +55,13 @@ def create_agent(
     WaldiezAgent
         The agent.
     """
-    # fmt: off
     skill1 = WaldiezSkill(
         id=f"ws-{counter}_1",
         name=f"skill{counter}_1",
         description=f"skill{counter}_1 description",
         data={  # type: ignore
-            "content": f"def skill{counter}_1():" + "\n" + f'    return "skill body of skill{counter}_1"',
-            "secrets": {
-                "SECRET_KEY_1": "SECRET_VALUE_1",
-                "SECRET_KEY_2": "SECRET_VALUE_2",
-            },
+            "content": SKILL_CONTENT_TEMPLATE.format(counter=counter, index=1),
+            "secrets": SKILL1_SECRETS,
         },
     )
     skill2 = WaldiezSkill(
@@ -56,11 +69,10 @@ def create_agent(
         name=f"skill{counter}_2",
         description=f"skill{counter}_2 description",
         data={  # type: ignore
-            "content": f"def skill{counter}_2():" + "\n" + f'    return "skill body of skill{counter}_2"',
+            "content": SKILL_CONTENT_TEMPLATE.format(counter=counter, index=2),
             "secrets": {},
         },
     )
-    # fmt: on
     model1 = WaldiezModel(
         id=f"wm-{counter}_1",
         name=f"model{counter}_1",
@@ -73,19 +85,7 @@ def create_agent(
         description=f"model{counter}_2 description",
         data={"apiType": "nim"},  # type: ignore
     )
-    agent_cls: Type[WaldiezAgent] = WaldiezAgent
-    if agent_type == "user":
-        agent_cls = WaldiezUserProxy
-    if agent_type == "assistant":
-        agent_cls = WaldiezAssistant
-    if agent_type == "rag_user":
-        agent_cls = WaldiezRagUser
-    if agent_type == "manager":
-        agent_cls = WaldiezGroupManager
-    if agent_type == "swarm":
-        agent_cls = WaldiezSwarmAgent
-    if agent_type == "reasoning":
-        agent_cls = WaldiezReasoningAgent
+    agent_cls = AGENT_CLASSES.get(agent_type, WaldiezAgent)
     agent = agent_cls(
         id=f"wa-{counter}",
         name=f"agent{counter}",
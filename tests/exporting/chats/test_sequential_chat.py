@@ -2,6 +2,10 @@
 # Copyright (c) 2024 - 2025 Waldiez and contributors.
 """Test waldiez.exporting.chats.ChatsExporter with a sequential chat."""
 
+from typing import Dict, List
+
+import pytest
+
 from waldiez.exporting.chats import ChatsExporter
 from waldiez.models import (
     WaldiezAgent,
@@ -11,102 +15,161 @@ from waldiez.models import (
 )
 
 
-# pylint: disable=too-many-locals
-def test_sequential_chat() -> None:
-    """Test ChatsExporter with a sequential chat."""
-    agent1_name = "agent1"
-    agent2_name = "agent2"
-    agent3_name = "agent3"
-    chat1_name = "chat1"
-    chat2_name = "chat2"
-    agent1 = WaldiezAgent(
-        id="wa-1",
-        name=agent1_name,
-        agent_type="assistant",
-        description="agent description",
-        data={},  # type: ignore
-    )
-    agent2 = WaldiezAgent(
-        id="wa-2",
-        name=agent2_name,
-        agent_type="assistant",
-        description="agent description",
-        data={},  # type: ignore
-    )
-    agent3 = WaldiezAgent(
-        id="wa-3",
-        name=agent3_name,
-        agent_type="assistant",
-        description="agent description",
-        data={},  # type: ignore
-    )
-    chat1 = WaldiezChat(
-        id="wc-1",
-        data=WaldiezChatData(
-            source="wa-1",
-            target="wa-2",
-            name=chat1_name,
-            description="A chat between two agents.",
-            message=WaldiezChatMessage(
-                type="string",
-                content="Hello, how are you?",
-            ),
-        ),
-    )
-    chat2 = WaldiezChat(
-        id="wc-2",
-        data=WaldiezChatData(
-            source="wa-2",
-            target="wa-3",
-            name=chat2_name,
-            description="A chat between two agents.",
-            message=WaldiezChatMessage(
-                type="string",
-                content="Hello, how are you?",
+@pytest.fixture(name="agents", scope="module")
+def agents_fixture() -> List[WaldiezAgent]:
+    """Fixture to provide the agents of the flow.
+
+    Returns
+    -------
+    List[WaldiezAgent]
+        The agents.
+    """
+    return [
+        WaldiezAgent(
+            id=f"wa-{index}",
+            name=f"agent{index}",
+            agent_type="assistant",
+            description="agent description",
+            data={},  # type: ignore
+        )
+        for index in range(1, 4)
+    ]
+
+
+@pytest.fixture(name="agent_names", scope="module")
+def agent_names_fixture(agents: List[WaldiezAgent]) -> Dict[str, str]:
+    """Fixture to provide the agent names.
+
+    Parameters
+    ----------
+    agents : List[WaldiezAgent]
+        The agents.
+
+    Returns
+    -------
+    Dict[str, str]
+        The agent names by id.
+    """
+    return {agent.id: agent.name for agent in agents}
+
+
+@pytest.fixture(name="chats", scope="module")
+def chats_fixture() -> List[WaldiezChat]:
+    """Fixture to provide the chats of the flow.
+
+    Returns
+    -------
+    List[WaldiezChat]
+        The chats.
+    """
+    return [
+        WaldiezChat(
+            id=f"wc-{index}",
+            data=WaldiezChatData(
+                source=f"wa-{index}",
+                target=f"wa-{index + 1}",
+                name=f"chat{index}",
+                description="A chat between two agents.",
+                message=WaldiezChatMessage(
+                    type="string",
+                    content="Hello, how are you?",
+                ),
             ),
-        ),
-    )
-    agent_names = {
-        "wa-1": agent1_name,
-        "wa-2": agent2_name,
-        "wa-3": agent3_name,
-    }
-    chat_names = {"wc-1": chat1_name, "wc-2": chat2_name}
+        )
+        for index in range(1, 3)
+    ]
+
+
+@pytest.fixture(name="chat_names", scope="module")
+def chat_names_fixture(chats: List[WaldiezChat]) -> Dict[str, str]:
+    """Fixture to provide the chat names.
+
+    Parameters
+    ----------
+    chats : List[WaldiezChat]
+        The chats.
+
+    Returns
+    -------
+    Dict[str, str]
+        The chat names by id.
+    """
+    return {chat.id: chat.name for chat in chats}
+
+
+# pylint: disable=too-many-locals
+@pytest.mark.parametrize(
+    "is_async,initiate_chats",
+    [
+        (False, "initiate_chats"),
+        (True, "a_initiate_chats"),
+    ],
+)
+def test_sequential_chat(
+    agents: List[WaldiezAgent],
+    agent_names: Dict[str, str],
+    chats: List[WaldiezChat],
+    chat_names: Dict[str, str],
+    is_async: bool,
+    initiate_chats: str,
+) -> None:
+    """Test ChatsExporter with a sequential chat.
+
+    Parameters
+    ----------
+    agents : List[WaldiezAgent]
+        The agents.
+    agent_names : Dict[str, str]
+        The agent names by id.
+    chats : List[WaldiezChat]
+        The chats.
+    chat_names : Dict[str, str]
+        The chat names by id.
+    is_async : bool
+        Whether the flow is async.
+    initiate_chats : str
+        The expected name of the chats' initiation function.
+    """
+    agent1, agent2, agent3 = agents
+    chat1, chat2 = chats
     main_chats = [(chat1, agent1, agent2), (chat2, agent2, agent3)]
     exporter = ChatsExporter(
         get_swarm_members=lambda _: ([], None),
-        all_agents=[agent1, agent2, agent3],
+        all_agents=agents,
         agent_names=agent_names,
-        all_chats=[chat1, chat2],
+        all_chats=chats,
         chat_names=chat_names,
         main_chats=main_chats,
         for_notebook=False,
-        is_async=False,
+        is_async=is_async,
     )
     generated = exporter.generate()
-    expected = """
-        results = initiate_chats([
-            {
+    await_ = "await " if is_async else ""
+    expected = f"""
+        results = {await_}{initiate_chats}([
+            {{
                 "sender": agent1,
                 "recipient": agent2,
                 "cache": cache,
                 "summary_method": "last_msg",
                 "chat_id": 0,
                 "message": "Hello, how are you?",
-            },
-            {
+            }},
+            {{
                 "sender": agent2,
                 "recipient": agent3,
                 "cache": cache,
                 "summary_method": "last_msg",
                 "chat_id": 0,
                 "message": "Hello, how are you?",
-            },
+            }},
         ])
 """
     assert generated == expected
     imports = exporter.get_imports()
     assert imports is not None
-    assert imports[0][0] == "from autogen.agentchat.chat import initiate_chats"
+    assert (
+        imports[0][0] == f"from autogen.agentchat.chat import {initiate_chats}"
+    )
     # no nested chats in agents
     assert not exporter.get_after_export()
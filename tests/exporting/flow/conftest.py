@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0.
+# Copyright (c) 2024 - 2025 Waldiez and contributors.
+"""Common fixtures for testing waldiez.exporting.flow.*.
+
+The flow parts are created once per module, tests that need
+to modify a flow should use a (deep) copy of it.
+"""
+
+from typing import List
+
+import pytest
+
+from waldiez.models import (
+    WaldiezAgents,
+    WaldiezChat,
+    WaldiezFlow,
+    WaldiezModel,
+    WaldiezSkill,
+)
+
+from .flow_helpers import (
+    build_flow,
+    get_agents,
+    get_chats,
+    get_model,
+    get_skills,
+)
+
+
+@pytest.fixture(name="flow_models", scope="module")
+def flow_models_fixture() -> List[WaldiezModel]:
+    """Get the models of the flow.
+
+    Returns
+    -------
+    List[WaldiezModel]
+        The models.
+    """
+    return [get_model()]
+
+
+@pytest.fixture(name="flow_skills", scope="module")
+def flow_skills_fixture() -> List[WaldiezSkill]:
+    """Get the skills of the flow.
+
+    Returns
+    -------
+    List[WaldiezSkill]
+        The skills.
+    """
+    return get_skills()
+
+
+@pytest.fixture(name="flow_agents", scope="module")
+def flow_agents_fixture() -> WaldiezAgents:
+    """Get the agents of the flow.
+
+    Returns
+    -------
+    WaldiezAgents
+        The agents.
+    """
+    return get_agents()
+
+
+@pytest.fixture(name="flow_chats", scope="module")
+def flow_chats_fixture() -> List[WaldiezChat]:
+    """Get the chats of the flow.
+
+    Returns
+    -------
+    List[WaldiezChat]
+        The chats.
+    """
+    return get_chats()
+
+
+@pytest.fixture(
+    name="flow",
+    scope="module",
+    params=[False, True],
+    ids=["sync", "async"],
+)
+def flow_fixture(
+    request: pytest.FixtureRequest,
+    flow_models: List[WaldiezModel],
+    flow_skills: List[WaldiezSkill],
+    flow_agents: WaldiezAgents,
+    flow_chats: List[WaldiezChat],
+) -> WaldiezFlow:
+    """Get a (sync and an async) WaldiezFlow instance.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        The request, its param is whether the flow is async.
+    flow_models : List[WaldiezModel]
+        The models of the flow.
+    flow_skills : List[WaldiezSkill]
+        The skills of the flow.
+    flow_agents : WaldiezAgents
+        The agents of the flow.
+    flow_chats : List[WaldiezChat]
+        The chats of the flow.
+
+    Returns
+    -------
+    WaldiezFlow
+        A WaldiezFlow instance.
+    """
+    return build_flow(
+        request.param,
+        models=flow_models,
+        skills=flow_skills,
+        agents=flow_agents,
+        chats=flow_chats,
+    )
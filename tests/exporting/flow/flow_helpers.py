@@ -2,7 +2,8 @@
 # Copyright (c) 2024 - 2025 Waldiez and contributors.
 """Helpers for getting a flow."""
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Final, List, Optional, Union, cast
 
 from typing_extensions import Literal
 
@@ -53,6 +54,81 @@ from waldiez.models import (
 
 from ...models.agents.captain_agent.example_agent_lib import EXAMPLE_AGENT_LIB
 
+# shared by all the agents
+DEFAULT_TEACHABILITY = WaldiezAgentTeachability(
+    enabled=False,
+    verbosity=0,
+    reset_db=False,
+    recall_threshold=1.5,
+    max_num_retrievals=10,
+)
+# skill "ws-1" with agent "wa-2" as its executor
+WS1_LINKED_TO_WA2 = WaldiezAgentLinkedSkill(
+    id="ws-1",
+    executor_id="wa-2",
+)
+
+# the keyword based termination messages of the agents
+BYE_FOUND = WaldiezAgentTerminationMessage(
+    type="keyword",
+    keywords=["bye", "goodbye"],
+    criterion="found",
+    method_content=None,
+)
+BYE_ENDING = WaldiezAgentTerminationMessage(
+    type="keyword",
+    keywords=["bye", "goodbye"],
+    criterion="ending",
+    method_content=None,
+)
+TERMINATE_EXACT = WaldiezAgentTerminationMessage(
+    type="keyword",
+    keywords=["TERMINATE"],
+    criterion="exact",
+    method_content=None,
+)
+
+# the (python) sources used in the flow's skills, agents and chats
+SKILL_CONTENT: Final[str] = (
+    "def skill_name():\n"
+    '    """Skill Description."""\n'
+    "    return 'Skill Response'"
+)
+ASSISTANT_TERMINATION: Final[str] = (
+    "def is_termination_message(message):\n"
+    '    """Check if the message is a termination message."""\n'
+    "    return any(\n"
+    '        keyword in message.get("content", "").lower()\n'
+    '        for keyword in ["bye", "goodbye"]\n'
+    "    )"
+)
+CUSTOM_SPEAKER_SELECTION: Final[str] = (
+    "def custom_speaker_selection(last_speaker, groupchat):\n"
+    "    return last_speaker"
+)
+CUSTOM_EMBEDDING: Final[str] = (
+    "def custom_embedding_function():\n    return list"
+)
+CUSTOM_UPDATE_SYSTEM_MESSAGE: Final[str] = (
+    "def custom_update_system_message(agent, messages):\n"
+    "    return messages[-1]"
+)
+CUSTOM_ON_CONDITION_AVAILABLE: Final[str] = (
+    "def custom_on_condition_available(agent, message):\n    return True"
+)
+CALLABLE_MESSAGE: Final[str] = (
+    "def callable_message(sender, recipient, context):\n"
+    '    return "hello there!!"'
+)
+CUSTOM_AFTER_WORK: Final[str] = (
+    "def custom_after_work(\n"
+    "    last_speaker,\n"
+    "    messages,\n"
+    "    groupchat\n"
+    "):\n"
+    "    return 'agent1'"
+)
+
 
 def get_model(model_id: str = "wm-1") -> WaldiezModel:
     """Get a WaldiezModel.
@@ -116,11 +192,7 @@ def get_skill(skill_id: str = "ws-1") -> WaldiezSkill:
         created_at="2021-01-01T00:00:00.000Z",
         updated_at="2021-01-01T00:00:00.000Z",
         data=WaldiezSkillData(
-            content=(
-                "def skill_name():\n"
-                '    """Skill Description."""\n'
-                "    return 'Skill Response'"
-            ),
+            content=SKILL_CONTENT,
             secrets={
                 "SKILL_KEY": "skill_value",
             },
@@ -199,19 +271,9 @@ def get_user_proxy(agent_id: str = "wa-1") -> WaldiezUserProxy:
             ),
             agent_default_auto_reply="I am a user.",
             max_consecutive_auto_reply=5,
-            termination=WaldiezAgentTerminationMessage(
-                type="keyword",
-                keywords=["bye", "goodbye"],
-                criterion="found",
-                method_content=None,
-            ),
+            termination=BYE_FOUND,
             model_ids=[],
-            skills=[
-                WaldiezAgentLinkedSkill(
-                    id="ws-1",
-                    executor_id="wa-2",
-                )
-            ],
+            skills=[WS1_LINKED_TO_WA2],
             nested_chats=[
                 WaldiezAgentNestedChat(
                     triggered_by=["wa-1"],
@@ -227,13 +289,7 @@ def get_user_proxy(agent_id: str = "wa-1") -> WaldiezUserProxy:
                     ],
                 ),
             ],
-            teachability=WaldiezAgentTeachability(
-                enabled=False,
-                verbosity=0,
-                reset_db=False,
-                recall_threshold=1.5,
-                max_num_retrievals=10,
-            ),
+            teachability=DEFAULT_TEACHABILITY,
         ),
     )
 
@@ -251,14 +307,6 @@ def get_assistant(agent_id: str = "wa-2") -> WaldiezAssistant:
     WaldiezAssistant
         A WaldiezAssistant instance.
     """
-    assistant_termination = (
-        "def is_termination_message(message):\n"
-        '    """Check if the message is a termination message."""\n'
-        "    return any(\n"
-        '        keyword in message.get("content", "").lower()\n'
-        '        for keyword in ["bye", "goodbye"]\n'
-        "    )"
-    )
     return WaldiezAssistant(
         id=agent_id,
         name="assistant",
@@ -279,23 +327,12 @@ def get_assistant(agent_id: str = "wa-2") -> WaldiezAssistant:
                 type="method",
                 keywords=[],
                 criterion="found",
-                method_content=assistant_termination,
+                method_content=ASSISTANT_TERMINATION,
             ),
             model_ids=["wm-1"],
-            skills=[
-                WaldiezAgentLinkedSkill(
-                    id="ws-1",
-                    executor_id="wa-2",
-                ),
-            ],
+            skills=[WS1_LINKED_TO_WA2],
             nested_chats=[],
-            teachability=WaldiezAgentTeachability(
-                enabled=False,
-                verbosity=0,
-                reset_db=False,
-                recall_threshold=1.5,
-                max_num_retrievals=10,
-            ),
+            teachability=DEFAULT_TEACHABILITY,
             is_multimodal=True,
         ),
     )
@@ -314,10 +351,6 @@ def get_group_manager(agent_id: str = "wa-3") -> WaldiezGroupManager:
     WaldiezGroupManager
         A WaldiezGroupManager instance.
     """
-    custom_speaker_selection = (
-        "def custom_speaker_selection(last_speaker, groupchat):\n"
-        "    return last_speaker"
-    )
     return WaldiezGroupManager(
         id=agent_id,
         name="group_manager",
@@ -338,19 +371,14 @@ def get_group_manager(agent_id: str = "wa-3") -> WaldiezGroupManager:
             code_execution_config=False,
             agent_default_auto_reply="I am a group manager.",
             max_consecutive_auto_reply=5,
-            termination=WaldiezAgentTerminationMessage(
-                type="keyword",
-                keywords=["TERMINATE"],
-                criterion="exact",
-                method_content=None,
-            ),
+            termination=TERMINATE_EXACT,
             model_ids=[],
             skills=[],
             nested_chats=[],
             speakers=WaldiezGroupManagerSpeakers(
                 selection_mode="transition",
                 selection_method="custom",
-                selection_custom_method=custom_speaker_selection,
+                selection_custom_method=CUSTOM_SPEAKER_SELECTION,
                 allow_repeat=["wa-1"],
                 max_retries_for_selecting=3,
                 allowed_or_disallowed_transitions={
@@ -359,13 +387,7 @@ def get_group_manager(agent_id: str = "wa-3") -> WaldiezGroupManager:
                 },
                 transitions_type="allowed",
             ),
-            teachability=WaldiezAgentTeachability(
-                enabled=False,
-                verbosity=0,
-                reset_db=False,
-                recall_threshold=1.5,
-                max_num_retrievals=10,
-            ),
+            teachability=DEFAULT_TEACHABILITY,
         ),
     )
 
@@ -383,7 +405,6 @@ def get_rag_user(agent_id: str = "wa-4") -> WaldiezRagUser:
     WaldiezRagUser
         A WaldiezRagUser instance.
     """
-    custom_embedding = "def custom_embedding_function():\n    return list"
     return WaldiezRagUser(
         id=agent_id,
         name="rag_user",
@@ -400,12 +421,7 @@ def get_rag_user(agent_id: str = "wa-4") -> WaldiezRagUser:
             code_execution_config=False,
             agent_default_auto_reply="I am rag user agent.",
             max_consecutive_auto_reply=5,
-            termination=WaldiezAgentTerminationMessage(
-                type="keyword",
-                criterion="ending",
-                keywords=["bye", "goodbye"],
-                method_content=None,
-            ),
+            termination=BYE_ENDING,
             model_ids=[],
             skills=[],
             nested_chats=[],
@@ -435,7 +451,7 @@ def get_rag_user(agent_id: str = "wa-4") -> WaldiezRagUser:
                 chunk_mode="multi_lines",
                 must_break_at_empty_line=True,
                 use_custom_embedding=True,
-                embedding_function=custom_embedding,
+                embedding_function=CUSTOM_EMBEDDING,
                 use_custom_text_split=False,
                 custom_text_split_function=None,
                 use_custom_token_count=False,
@@ -451,17 +467,67 @@ def get_rag_user(agent_id: str = "wa-4") -> WaldiezRagUser:
                 n_results=10,
                 customized_prompt=None,
             ),
-            teachability=WaldiezAgentTeachability(
-                enabled=False,
-                verbosity=0,
-                reset_db=False,
-                recall_threshold=1.5,
-                max_num_retrievals=10,
-            ),
+            teachability=DEFAULT_TEACHABILITY,
         ),
     )
 
 
+# the swarm agent's (validated once) updates and handoffs
+SWARM_UPDATES: List[Union[WaldiezSwarmUpdateSystemMessage, str]] = [
+    WaldiezSwarmUpdateSystemMessage(
+        update_function_type="string",
+        update_function="Use template for the {variable}.",
+    ),
+    WaldiezSwarmUpdateSystemMessage(
+        update_function_type="callable",
+        update_function=CUSTOM_UPDATE_SYSTEM_MESSAGE,
+    ),
+    "ws-1",
+]
+SWARM_HANDOFFS: List[Union[WaldiezSwarmOnCondition, WaldiezSwarmAfterWork]] = [
+    WaldiezSwarmOnCondition(
+        target=WaldiezSwarmOnConditionTarget(
+            id="wa-1",
+            order=1,
+        ),
+        target_type="agent",
+        condition="go to agent 1",
+        available=WaldiezSwarmOnConditionAvailable(
+            type="none",
+            value=None,
+        ),
+    ),
+    WaldiezSwarmOnCondition(
+        target=WaldiezSwarmOnConditionTarget(
+            id="wa-2",
+            order=2,
+        ),
+        target_type="agent",
+        condition="go to agent 2",
+        available=WaldiezSwarmOnConditionAvailable(
+            type="string",
+            value="bool_variable",
+        ),
+    ),
+    WaldiezSwarmOnCondition(
+        target=WaldiezSwarmOnConditionTarget(
+            id="wa-3",
+            order=3,
+        ),
+        target_type="agent",
+        condition="go to agent 3",
+        available=WaldiezSwarmOnConditionAvailable(
+            type="callable",
+            value=CUSTOM_ON_CONDITION_AVAILABLE,
+        ),
+    ),
+    WaldiezSwarmAfterWork(
+        recipient_type="option",
+        recipient="REVERT_TO_USER",
+    ),
+]
+
+
 def get_swarm_agent(agent_id: str = "wa-5") -> WaldiezSwarmAgent:
     """Get a WaldiezSwarmAgent.
 
@@ -491,85 +557,16 @@ def get_swarm_agent(agent_id: str = "wa-5") -> WaldiezSwarmAgent:
             code_execution_config=False,
             agent_default_auto_reply="I am a swarm agent.",
             max_consecutive_auto_reply=5,
-            termination=WaldiezAgentTerminationMessage(
-                type="keyword",
-                criterion="ending",
-                keywords=["bye", "goodbye"],
-                method_content=None,
-            ),
+            termination=BYE_ENDING,
             model_ids=[],
             skills=[],
             nested_chats=[],
-            teachability=WaldiezAgentTeachability(
-                enabled=False,
-                verbosity=0,
-                reset_db=False,
-                recall_threshold=1.5,
-                max_num_retrievals=10,
-            ),
+            teachability=DEFAULT_TEACHABILITY,
             is_initial=True,
             functions=["ws-1"],
-            update_agent_state_before_reply=[
-                WaldiezSwarmUpdateSystemMessage(
-                    update_function_type="string",
-                    update_function="Use template for the {variable}.",
-                ),
-                WaldiezSwarmUpdateSystemMessage(
-                    update_function_type="callable",
-                    update_function=(
-                        "def custom_update_system_message(agent, messages):\n"
-                        "    return messages[-1]"
-                    ),
-                ),
-                "ws-1",
-            ],
+            update_agent_state_before_reply=list(SWARM_UPDATES),
             # we need to check if use this or get this from the chats
-            handoffs=[
-                WaldiezSwarmOnCondition(
-                    target=WaldiezSwarmOnConditionTarget(
-                        id="wa-1",
-                        order=1,
-                    ),
-                    target_type="agent",
-                    condition="go to agent 1",
-                    available=WaldiezSwarmOnConditionAvailable(
-                        type="none",
-                        value=None,
-                    ),
-                ),
-                WaldiezSwarmOnCondition(
-                    target=WaldiezSwarmOnConditionTarget(
-                        id="wa-2",
-                        order=2,
-                    ),
-                    target_type="agent",
-                    condition="go to agent 2",
-                    available=WaldiezSwarmOnConditionAvailable(
-                        type="string",
-                        value="bool_variable",
-                    ),
-                ),
-                WaldiezSwarmOnCondition(
-                    target=WaldiezSwarmOnConditionTarget(
-                        id="wa-3",
-                        order=3,
-                    ),
-                    target_type="agent",
-                    condition="go to agent 3",
-                    available=WaldiezSwarmOnConditionAvailable(
-                        type="callable",
-                        # pylint: disable=line-too-long
-                        value=(
-                            "def custom_on_condition_available(agent, message):\n"  # noqa: E501
-                            "    return True"
-                        ),
-                    ),
-                ),
-                WaldiezSwarmAfterWork(
-                    recipient_type="option",
-                    recipient="REVERT_TO_USER",
-                ),
-            ],
+            handoffs=list(SWARM_HANDOFFS),
         ),
     )
 
@@ -603,22 +600,11 @@ def get_reasoning_agent(agent_id: str = "wa-6") -> WaldiezReasoningAgent:
             code_execution_config=False,
             agent_default_auto_reply="I am a reasoning agent.",
             max_consecutive_auto_reply=5,
-            termination=WaldiezAgentTerminationMessage(
-                type="keyword",
-                criterion="ending",
-                keywords=["bye", "goodbye"],
-                method_content=None,
-            ),
+            termination=BYE_ENDING,
             model_ids=[],
             skills=[],
             nested_chats=[],
-            teachability=WaldiezAgentTeachability(
-                enabled=False,
-                verbosity=0,
-                reset_db=False,
-                recall_threshold=1.5,
-                max_num_retrievals=10,
-            ),
+            teachability=DEFAULT_TEACHABILITY,
             verbose=True,
             reason_config=WaldiezReasoningAgentReasonConfig(
                 method="beam_search",
@@ -654,22 +640,11 @@ def get_captain_agent() -> WaldiezCaptainAgent:
         ),
         agent_default_auto_reply="I am a captain agent.",
         max_consecutive_auto_reply=5,
-        termination=WaldiezAgentTerminationMessage(
-            type="keyword",
-            criterion="ending",
-            keywords=["bye", "goodbye"],
-            method_content=None,
-        ),
+        termination=BYE_ENDING,
         model_ids=["wm-1"],
         skills=[],
         nested_chats=[],
-        teachability=WaldiezAgentTeachability(
-            enabled=False,
-            verbosity=0,
-            reset_db=False,
-            recall_threshold=1.5,
-            max_num_retrievals=10,
-        ),
+        teachability=DEFAULT_TEACHABILITY,
         agent_lib=EXAMPLE_AGENT_LIB,  # type: ignore
         tool_lib="default",
     )
@@ -687,6 +662,16 @@ def get_captain_agent() -> WaldiezCaptainAgent:
     )
 
 
+# no nested chat (no message, no reply), shared by all the chats
+EMPTY_NESTED_CHAT = WaldiezChatNested(message=None, reply=None)
+
+# the after work of the fourth chat
+CHAT4_AFTER_WORK = WaldiezSwarmAfterWork(
+    recipient_type="callable",
+    recipient=CUSTOM_AFTER_WORK,
+)
+
+
 def get_chats(count: int = 7) -> List[WaldiezChat]:
     """Get a list of WaldiezChat instances.
 
@@ -700,49 +685,32 @@ def get_chats(count: int = 7) -> List[WaldiezChat]:
     List[WaldiezChat]
         A list of WaldiezChat instances
     """
-    chats = []
-    custom_message = (
-        "def callable_message(sender, recipient, context):\n"
-        '    return "hello there!!"'
-    )
+    chats: List[Optional[WaldiezChat]] = [None] * count
+    chat_ids = [f"wc-{index + 1}" for index in range(count)]
+    # the index-dependent parts of the chats (a new context dict per chat)
+    contexts: List[Dict[str, Any]] = [{} for _ in range(count)]
+    contents = [f"Hello wa-{index + 1}" for index in range(count)]
+    after_works: List[Optional[WaldiezSwarmAfterWork]] = [None] * count
+    if count > 0:
+        contexts[0]["problem"] = "Solve tha task."
+    if count > 2:
+        contents[2] = CALLABLE_MESSAGE
+    if count > 3:
+        contexts[3].update(problem="Solve tha task.", bool_variable=True)
+        after_works[3] = CHAT4_AFTER_WORK
     for index in range(count):
-        chat_id = f"wc-{index + 1}"
-        context: Dict[str, Any] = {}
-        if index in (0, 3):
-            context["problem"] = "Solve tha task."
-        if index == 3:
-            context["bool_variable"] = True
-        nested_chat = WaldiezChatNested(
-            message=None,
-            reply=None,
-        )
-        source_index = index + 1
-        target_index = index + 2
-        chat_after_work: Optional[WaldiezSwarmAfterWork] = None
-        if index == 3:
-            chat_after_work = WaldiezSwarmAfterWork(
-                recipient_type="callable",
-                recipient=(
-                    "def custom_after_work(\n"
-                    "    last_speaker,\n"
-                    "    messages,\n"
-                    "    groupchat\n"
-                    "):\n"
-                    "    return 'agent1'"
-                ),
-            )
-        prerequisites = []
+        prerequisites: List[str] = []
         if index == 1:
-            prerequisites = ["wc-1"]
+            prerequisites = chat_ids[:1]
         elif index > 2:
-            prerequisites = [f"wc-{idx + 1}" for idx in range(index - 1)]
+            prerequisites = chat_ids[: index - 1]
         chat = WaldiezChat(
-            id=chat_id,
+            id=chat_ids[index],
             data=WaldiezChatData(
                 name=f"chat_{index + 1}",
                 description=f"Description of chat {index + 1}",
-                source=f"wa-{source_index}",
-                target=f"wa-{target_index}",
+                source=f"wa-{index + 1}",
+                target=f"wa-{index + 2}",
                 position=-1,
                 order=index,
                 clear_history=True,
@@ -751,12 +719,8 @@ def get_chats(count: int = 7) -> List[WaldiezChat]:
                 message=WaldiezChatMessage(
                     type="string" if index != 2 else "method",
                     use_carryover=index == 2,
-                    content=(
-                        f"Hello wa-{source_index}"
-                        if index != 2
-                        else custom_message
-                    ),
-                    context=context,
+                    content=contents[index],
+                    context=contexts[index],
                 ),
                 summary=WaldiezChatSummary(
                     method=(
@@ -765,56 +729,83 @@ def get_chats(count: int = 7) -> List[WaldiezChat]:
                     prompt="Summarize the chat.",
                     args={"summary_role": "user"},
                 ),
-                nested_chat=nested_chat,
+                nested_chat=EMPTY_NESTED_CHAT,
                 real_source=None,
                 real_target=None,
                 available=WaldiezSwarmOnConditionAvailable(
                     type="none",
                     value=None,
                 ),
-                after_work=chat_after_work,
+                after_work=after_works[index],
                 prerequisites=prerequisites,
             ),
         )
-        chats.append(chat)
-    return chats
+        chats[index] = chat
+    return cast(List[WaldiezChat], chats)
 
 
-def get_flow(is_async: bool = False) -> WaldiezFlow:
-    """Get a WaldiezFlow instance.
+def get_skills() -> List[WaldiezSkill]:
+    """Get the skills of the flow.
+
+    Returns
+    -------
+    List[WaldiezSkill]
+        The custom, the langchain and the crewai skills.
+    """
+    return [
+        get_skill(),
+        get_interop_skill(skill_type="langchain"),
+        get_interop_skill(skill_id="ws-3", skill_type="crewai"),
+    ]
+
+
+def get_agents() -> WaldiezAgents:
+    """Get the agents of the flow.
+
+    Returns
+    -------
+    WaldiezAgents
+        A WaldiezAgents instance (one agent of each type).
+    """
+    return WaldiezAgents(
+        users=[get_user_proxy()],
+        assistants=[get_assistant()],
+        managers=[get_group_manager()],
+        rag_users=[get_rag_user()],
+        swarm_agents=[get_swarm_agent()],
+        reasoning_agents=[get_reasoning_agent()],
+        captain_agents=[get_captain_agent()],
+    )
+
+
+def build_flow(
+    is_async: bool,
+    models: List[WaldiezModel],
+    skills: List[WaldiezSkill],
+    agents: WaldiezAgents,
+    chats: List[WaldiezChat],
+) -> WaldiezFlow:
+    """Build a WaldiezFlow instance from already created parts.
 
     Parameters
     ----------
-    is_async : bool, optional
-        Whether the flow is asynchronous, by default False.
+    is_async : bool
+        Whether the flow is asynchronous.
+    models : List[WaldiezModel]
+        The models of the flow.
+    skills : List[WaldiezSkill]
+        The skills of the flow.
+    agents : WaldiezAgents
+        The agents of the flow.
+    chats : List[WaldiezChat]
+        The chats of the flow.
 
     Returns
     -------
     WaldiezFlow
         A WaldiezFlow instance.
     """
-    model = get_model()
-    custom_skill = get_skill()
-    langchain_skill = get_interop_skill(skill_type="langchain")
-    crewai_skill = get_interop_skill(skill_id="ws-3", skill_type="crewai")
-    user = get_user_proxy()
-    assistant = get_assistant()
-    manager = get_group_manager()
-    rag_user = get_rag_user()
-    swarm_agent = get_swarm_agent()
-    reasoning_agent = get_reasoning_agent()
-    captain_agent = get_captain_agent()
-    chats = get_chats()
-    agents = WaldiezAgents(
-        users=[user],
-        assistants=[assistant],
-        managers=[manager],
-        rag_users=[rag_user],
-        swarm_agents=[swarm_agent],
-        reasoning_agents=[reasoning_agent],
-        captain_agents=[captain_agent],
-    )
-    flow = WaldiezFlow(
+    return WaldiezFlow(
         id="wf-1",
         name="flow_name",
         type="flow",
@@ -830,9 +821,63 @@ def get_flow(is_async: bool = False) -> WaldiezFlow:
             edges=[],
             viewport={},
             agents=agents,
-            models=[model],
-            skills=[custom_skill, langchain_skill, crewai_skill],
+            models=models,
+            skills=skills,
             chats=chats,
         ),
     )
-    return flow
+
+
+def _build_flow_slow(is_async: bool) -> WaldiezFlow:
+    """Build a WaldiezFlow instance from scratch.
+
+    Parameters
+    ----------
+    is_async : bool
+        Whether the flow is asynchronous.
+
+    Returns
+    -------
+    WaldiezFlow
+        A WaldiezFlow instance.
+    """
+    return build_flow(
+        is_async,
+        models=[get_model()],
+        skills=get_skills(),
+        agents=get_agents(),
+        chats=get_chats(),
+    )
+
+
+@lru_cache(maxsize=2)
+def _get_flow_json(is_async: bool) -> str:
+    """Get the (cached) JSON prototype of a flow.
+
+    Parameters
+    ----------
+    is_async : bool
+        Whether the flow is asynchronous.
+
+    Returns
+    -------
+    str
+        The JSON dump of the flow.
+    """
+    return _build_flow_slow(is_async).model_dump_json(by_alias=True)
+
+
+def get_flow(is_async: bool = False) -> WaldiezFlow:
+    """Get a WaldiezFlow instance.
+
+    Parameters
+    ----------
+    is_async : bool, optional
+        Whether the flow is asynchronous, by default False.
+
+    Returns
+    -------
+    WaldiezFlow
+        A WaldiezFlow instance.
+    """
+    return WaldiezFlow.model_validate_json(_get_flow_json(is_async))
@@ -8,9 +8,7 @@ from pathlib import Path
 import jupytext  # type: ignore[import-untyped]
 
 from waldiez.exporting.flow.flow_exporter import FlowExporter
-from waldiez.models import Waldiez
-
-from .flow_helpers import get_flow
+from waldiez.models import Waldiez, WaldiezFlow
 
 MY_DIR = Path(__file__).resolve().parent
 ROOT_DIR = MY_DIR.parent.parent.parent
@@ -18,22 +16,25 @@ DOT_LOCAL = ROOT_DIR / ".local"
 DOT_LOCAL.mkdir(exist_ok=True, parents=True)
 
 
-def _export_flow(tmp_path: Path, is_async: bool, extension: str = "py") -> None:
+def _export_flow(
+    tmp_path: Path, flow: WaldiezFlow, extension: str = "py"
+) -> None:
     """Export flow to py.
 
     Parameters
     ----------
     tmp_path : Path
         Temporary directory.
-    is_async : bool
-        Whether the flow is async.
+    flow : WaldiezFlow
+        The flow to export.
+    extension : str, optional
+        The extension of the exported file, by default "py".
     """
-    sync_mode = "async" if is_async else "sync"
+    sync_mode = "async" if flow.is_async else "sync"
     output_dir = tmp_path / f"test_export_flow_{extension}_{sync_mode}"
     if output_dir.exists():
         shutil.rmtree(output_dir, ignore_errors=True)
     output_dir.mkdir(exist_ok=True)
-    flow = get_flow(is_async=is_async)
     waldiez = Waldiez(flow=flow)
     exporter = FlowExporter(
         waldiez,
@@ -57,45 +58,27 @@ def _export_flow(tmp_path: Path, is_async: bool, extension: str = "py") -> None:
         destination_path.unlink(missing_ok=True)
 
 
-def test_flow_exporter_to_py_sync(tmp_path: Path) -> None:
-    """Test FlowExporter export to py.
-
-    Parameters
-    ----------
-    tmp_path : Path
-        Temporary directory.
-    """
-    _export_flow(tmp_path, is_async=False)
-
-
-def test_flow_exporter_to_py_async(tmp_path: Path) -> None:
-    """Test FlowExporter export to async py.
-
-    Parameters
-    ----------
-    tmp_path : Path
-        Temporary directory.
-    """
-    _export_flow(tmp_path, is_async=True)
-
-
-def test_flow_export_sync_to_ipynb(tmp_path: Path) -> None:
-    """Test FlowExporter export to ipynb.
+def test_flow_exporter_to_py(tmp_path: Path, flow: WaldiezFlow) -> None:
+    """Test FlowExporter export to (sync and async) py.
 
     Parameters
     ----------
     tmp_path : Path
         Temporary directory.
+    flow : WaldiezFlow
+        The (sync or async) flow to export.
     """
-    _export_flow(tmp_path, is_async=False, extension="ipynb")
+    _export_flow(tmp_path, flow)
 
 
-def test_flow_export_async_to_ipynb(tmp_path: Path) -> None:
-    """Test FlowExporter export to async ipynb.
+def test_flow_export_to_ipynb(tmp_path: Path, flow: WaldiezFlow) -> None:
+    """Test FlowExporter export to (sync and async) ipynb.
 
     Parameters
     ----------
     tmp_path : Path
         Temporary directory.
+    flow : WaldiezFlow
+        The (sync or async) flow to export.
     """
-    _export_flow(tmp_path, is_async=True, extension="ipynb")
+    _export_flow(tmp_path, flow, extension="ipynb")
@@ -6,19 +6,22 @@ from typing import Any, Dict
 
 from waldiez.exporting.base.mixin import ExporterMixin
 from waldiez.exporting.flow.utils.flow_names import ensure_unique_names
-from waldiez.models import Waldiez
-
-from ..flow_helpers import get_flow
+from waldiez.models import Waldiez, WaldiezFlow
 
 
 # pylint: disable=too-many-locals
-def test_ensure_unique_names() -> None:
-    """Test ensure_unique_names."""
+def test_ensure_unique_names(flow: WaldiezFlow) -> None:
+    """Test ensure_unique_names.
+
+    Parameters
+    ----------
+    flow : WaldiezFlow
+        The flow to use.
+    """
     get_valid_instance_name = ExporterMixin.get_valid_instance_name
     max_length = 4
     flow_name_max_length = 3
-    waldiez_flow = get_flow()
-    waldiez = Waldiez(flow=waldiez_flow)
+    waldiez = Waldiez(flow=flow)
     result = ensure_unique_names(
         waldiez, get_valid_instance_name, max_length, flow_name_max_length
     )
@@ -32,7 +35,7 @@ def test_ensure_unique_names() -> None:
     assert isinstance(result["skills"], list)
     assert isinstance(result["chats"], list)
     assert isinstance(result["flow_name"], str)
-    assert result["flow_name"] == waldiez_flow.name[:flow_name_max_length]
+    assert result["flow_name"] == flow.name[:flow_name_max_length]
     result_dict: Dict[str, Any] = result  # type: ignore
     for key in ["agent_names", "model_names", "skill_names", "chat_names"]:
         # key in dict: the "id" of the instance
@@ -2,66 +2,176 @@
 # Copyright (c) 2024 - 2025 Waldiez and contributors.
 """Test waldiez.exporting.models.ModelsExporter."""
 
-import shutil
 from pathlib import Path
+from typing import Dict, Tuple
+
+import pytest
 
 from waldiez.exporting.models import ModelsExporter
 from waldiez.models.agents import WaldiezAgent
 from waldiez.models.model import DEFAULT_BASE_URLS, WaldiezModel
 
+FLOW_NAME = "flow1"
+EXPECTED_IMPORT = (
+    f"from {FLOW_NAME}_api_keys import (\n"
+    f"    get_{FLOW_NAME}_model_api_key,\n"
+    ")\n"
+)
+EXPECTED_LLM_CONFIG = (
+    "    llm_config={\n"
+    '        "config_list": [\n'
+    "            model1_llm_config,\n"
+    "            model2_llm_config,\n"
+    "        ],\n"
+    '        "cache_seed": 42,\n'
+    "    },\n"
+)
+EXPECTED_GENERATED = f"""
+model1_llm_config = {{
+    "model": "model1",
+    "api_type": "anthropic",
+    "api_key": get_{FLOW_NAME}_model_api_key("model1")
+}}
 
-# pylint: disable=too-many-locals,too-many-statements
-def test_models_exporter(tmp_path: Path) -> None:
-    """Test ModelsExporter.
+model2_llm_config = {{
+    "model": "model2",
+    "api_key": get_{FLOW_NAME}_model_api_key("model2"),
+    "base_url": "{DEFAULT_BASE_URLS["nim"]}"
+}}
 
-    Parameters
-    ----------
-    tmp_path : Path
-        The temporary path.
-    """
+model3_llm_config = {{
+    "model": "model3",
+    "api_type": "google",
+    "api_key": get_{FLOW_NAME}_model_api_key("model3")
+}}
+"""
 
-    flow_name = "flow1"
-    model1_name = "model1"
-    model2_name = "model2"
-    model3_name = "model3"
-    agent = WaldiezAgent(
-        id="wa-1",
-        name="agent1",
-        agent_type="assistant",
-        description="agent description",
-        data={  # type: ignore
-            "model_ids": ["wm-1", "wm-2"],
-        },
-    )
-    agent_names = {"wa-1": "agent1"}
+
+@pytest.fixture(name="models", scope="module")
+def models_fixture() -> Tuple[WaldiezModel, WaldiezModel, WaldiezModel]:
+    """Get the models to export.
+
+    Returns
+    -------
+    Tuple[WaldiezModel, WaldiezModel, WaldiezModel]
+        The models.
+    """
     model1 = WaldiezModel(
         id="wm-1",
-        name=model1_name,
+        name="model1",
         description="model description",
         data={"apiType": "anthropic"},  # type: ignore
     )
     model2 = WaldiezModel(
         id="wm-2",
-        name=model2_name,
+        name="model2",
         description="model description",
         data={"apiType": "nim"},  # type: ignore
     )
     model3 = WaldiezModel(
         id="wm-3",
-        name=model3_name,
+        name="model3",
         description="model description",
         data={"apiType": "google"},  # type: ignore
     )
-    model_names = {
-        "wm-1": model1_name,
-        "wm-2": model2_name,
-        "wm-3": model3_name,
-    }
+    return model1, model2, model3
+
+
+@pytest.fixture(name="model_names", scope="module")
+def model_names_fixture(
+    models: Tuple[WaldiezModel, WaldiezModel, WaldiezModel],
+) -> Dict[str, str]:
+    """Get the model names.
+
+    Parameters
+    ----------
+    models : Tuple[WaldiezModel, WaldiezModel, WaldiezModel]
+        The models.
+
+    Returns
+    -------
+    Dict[str, str]
+        The model names by id.
+    """
+    return {model.id: model.name for model in models}
+
+
+@pytest.fixture(name="agent", scope="module")
+def agent_fixture() -> WaldiezAgent:
+    """Get an agent linked with the first two models.
+
+    Returns
+    -------
+    WaldiezAgent
+        The agent.
+    """
+    return WaldiezAgent(
+        id="wa-1",
+        name="agent1",
+        agent_type="assistant",
+        description="agent description",
+        data={  # type: ignore
+            "model_ids": ["wm-1", "wm-2"],
+        },
+    )
+
+
+@pytest.fixture(name="agent_without_models", scope="module")
+def agent_without_models_fixture() -> WaldiezAgent:
+    """Get an agent with no linked models.
+
+    Returns
+    -------
+    WaldiezAgent
+        The agent.
+    """
+    return WaldiezAgent(
+        id="wa-1",
+        name="agent1",
+        agent_type="assistant",
+        description="agent description",
+        data={  # type: ignore
+            "model_ids": [],
+        },
+    )
+
+
+@pytest.fixture(name="agent_names", scope="module")
+def agent_names_fixture() -> Dict[str, str]:
+    """Get the agent names.
+
+    Returns
+    -------
+    Dict[str, str]
+        The agent names by id.
+    """
+    return {"wa-1": "agent1"}
+
+
+def test_models_exporter_basic(
+    agent: WaldiezAgent,
+    agent_names: Dict[str, str],
+    models: Tuple[WaldiezModel, WaldiezModel, WaldiezModel],
+    model_names: Dict[str, str],
+) -> None:
+    """Test ModelsExporter without an output directory.
+
+    Parameters
+    ----------
+    agent : WaldiezAgent
+        The agent.
+    agent_names : Dict[str, str]
+        The agent names by id.
+    models : Tuple[WaldiezModel, WaldiezModel, WaldiezModel]
+        The models.
+    model_names : Dict[str, str]
+        The model names by id.
+    """
     models_exporter = ModelsExporter(
-        flow_name=flow_name,
+        flow_name=FLOW_NAME,
         agents=[agent],
         agent_names=agent_names,
-        models=[model1, model2, model3],
+        models=list(models),
         model_names=model_names,
         for_notebook=False,
         output_dir=None,
@@ -70,33 +180,36 @@ def test_models_exporter(tmp_path: Path) -> None:
     imports = models_exporter.get_imports()
     assert imports is None
     generated_string = models_exporter.generate()
-    expected = f"""
-{model1_name}_llm_config = {{
-    "model": "{model1_name}",
-    "api_type": "anthropic",
-    "api_key": get_{flow_name}_model_api_key("{model1_name}")
-}}
+    assert generated_string == EXPECTED_GENERATED
 
-{model2_name}_llm_config = {{
-    "model": "{model2_name}",
-    "api_key": get_{flow_name}_model_api_key("{model2_name}"),
-    "base_url": "{DEFAULT_BASE_URLS["nim"]}"
-}}
 
-{model3_name}_llm_config = {{
-    "model": "{model3_name}",
-    "api_type": "google",
-    "api_key": get_{flow_name}_model_api_key("{model3_name}")
-}}
-"""
-    assert generated_string == expected
-    output_dir = tmp_path / "test_models_exporter"
-    output_dir.mkdir(exist_ok=True)
+def test_models_exporter_notebook(
+    tmp_path: Path,
+    agent: WaldiezAgent,
+    agent_names: Dict[str, str],
+    models: Tuple[WaldiezModel, WaldiezModel, WaldiezModel],
+    model_names: Dict[str, str],
+) -> None:
+    """Test ModelsExporter for a notebook with an output directory.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        The temporary path.
+    agent : WaldiezAgent
+        The agent.
+    agent_names : Dict[str, str]
+        The agent names by id.
+    models : Tuple[WaldiezModel, WaldiezModel, WaldiezModel]
+        The models.
+    model_names : Dict[str, str]
+        The model names by id.
+    """
     models_exporter = ModelsExporter(
-        flow_name=flow_name,
+        flow_name=FLOW_NAME,
         agents=[agent],
         agent_names=agent_names,
-        models=[model1, model2],
+        models=list(models[:2]),
         model_names=model_names,
         for_notebook=True,
         output_dir=str(tmp_path),
@@ -104,43 +217,41 @@ def test_models_exporter(tmp_path: Path) -> None:
     )
     imports = models_exporter.get_imports()
     assert imports is not None
-    expected_import_string = (
-        f"from {flow_name}_api_keys import ("
-        "\n"
-        f"    get_{flow_name}_model_api_key,"
-        "\n"
-        ")\n"
-    )
-    assert imports[0][0] == expected_import_string
+    assert imports[0][0] == EXPECTED_IMPORT
     assert imports[0][1].name == "LOCAL"
     after_export = models_exporter.get_after_export()
     assert after_export is not None
-    assert after_export[0][0] == (
-        "    llm_config={\n"
-        '        "config_list": [\n'
-        f"            {model1_name}_llm_config," + "\n"
-        f"            {model2_name}_llm_config," + "\n"
-        "        ],\n"
-        '        "cache_seed": 42,\n'
-        "    },\n"
-    )
-    assert (tmp_path / f"{flow_name}_api_keys.py").exists()
-    shutil.rmtree(output_dir)
+    assert after_export[0][0] == EXPECTED_LLM_CONFIG
+    assert (tmp_path / f"{FLOW_NAME}_api_keys.py").exists()
 
-    agent = WaldiezAgent(
-        id="wa-1",
-        name="agent1",
-        agent_type="assistant",
-        description="agent description",
-        data={  # type: ignore
-            "model_ids": [],
-        },
-    )
+
+def test_models_exporter_empty_model_ids(
+    tmp_path: Path,
+    agent_without_models: WaldiezAgent,
+    agent_names: Dict[str, str],
+    models: Tuple[WaldiezModel, WaldiezModel, WaldiezModel],
+    model_names: Dict[str, str],
+) -> None:
+    """Test ModelsExporter with an agent without linked models.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        The temporary path.
+    agent_without_models : WaldiezAgent
+        The agent.
+    agent_names : Dict[str, str]
+        The agent names by id.
+    models : Tuple[WaldiezModel, WaldiezModel, WaldiezModel]
+        The models.
+    model_names : Dict[str, str]
+        The model names by id.
+    """
     models_exporter = ModelsExporter(
-        flow_name=flow_name,
-        agents=[agent],
+        flow_name=FLOW_NAME,
+        agents=[agent_without_models],
         agent_names=agent_names,
-        models=[model1, model2, model3],
+        models=list(models),
         model_names=model_names,
         for_notebook=False,
         output_dir=str(tmp_path),
@@ -148,14 +259,12 @@ def test_models_exporter(tmp_path: Path) -> None:
     )
     assert models_exporter.get_imports() is not None
     generated_string = models_exporter.generate()
-    assert generated_string == expected
-    output_dir = tmp_path / "test_models_exporter"
-    output_dir.mkdir(exist_ok=True)
+    assert generated_string == EXPECTED_GENERATED
     models_exporter = ModelsExporter(
-        flow_name=flow_name,
-        agents=[agent],
+        flow_name=FLOW_NAME,
+        agents=[agent_without_models],
         agent_names=agent_names,
-        models=[model1, model2],
+        models=list(models[:2]),
         model_names=model_names,
         for_notebook=True,
         output_dir=str(tmp_path),
@@ -163,36 +272,102 @@ def test_models_exporter(tmp_path: Path) -> None:
     )
     imports = models_exporter.get_imports()
     assert imports is not None
-    expected_import_string = (
-        f"from {flow_name}_api_keys import (" + "\n"
-        f"    get_{flow_name}_model_api_key," + "\n"
-        ")\n"
-    )
-    assert imports[0][0] == expected_import_string
+    assert imports[0][0] == EXPECTED_IMPORT
     assert imports[0][1].name == "LOCAL"
-    assert (tmp_path / f"{flow_name}_api_keys.py").exists()
-    shutil.rmtree(output_dir)
+    assert (tmp_path / f"{FLOW_NAME}_api_keys.py").exists()
+
 
+def test_models_exporter_no_cache_seed(
+    tmp_path: Path,
+    agent_without_models: WaldiezAgent,
+    agent_names: Dict[str, str],
+    models: Tuple[WaldiezModel, WaldiezModel, WaldiezModel],
+    model_names: Dict[str, str],
+) -> None:
+    """Test ModelsExporter with no cache seed and no linked models.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        The temporary path.
+    agent_without_models : WaldiezAgent
+        The agent.
+    agent_names : Dict[str, str]
+        The agent names by id.
+    models : Tuple[WaldiezModel, WaldiezModel, WaldiezModel]
+        The models.
+    model_names : Dict[str, str]
+        The model names by id.
+    """
+    models_exporter = ModelsExporter(
+        flow_name=FLOW_NAME,
+        agents=[agent_without_models],
+        agent_names=agent_names,
+        models=list(models[:2]),
+        model_names=model_names,
+        for_notebook=False,
+        output_dir=str(tmp_path),
+        cache_seed=None,
+    )
+    assert models_exporter.get_imports() is not None
+    after_export = models_exporter.get_after_export()
+    assert after_export is not None
+    assert after_export[0][0] == "    llm_config=False,\n"
+
+
+@pytest.mark.parametrize(
+    "api_type,expected_snippet",
+    [
+        ("anthropic", '    "api_type": "anthropic",\n'),
+        ("nim", f'    "base_url": "{DEFAULT_BASE_URLS["nim"]}"\n'),
+        ("google", '    "api_type": "google",\n'),
+    ],
+)
+def test_models_exporter_api_type(
+    agent_names: Dict[str, str],
+    api_type: str,
+    expected_snippet: str,
+) -> None:
+    """Test ModelsExporter with a model of each api type.
+
+    Parameters
+    ----------
+    agent_names : Dict[str, str]
+        The agent names by id.
+    api_type : str
+        The model's api type.
+    expected_snippet : str
+        The api type specific part of the generated llm config.
+    """
+    model = WaldiezModel(
+        id="wm-1",
+        name="model1",
+        description="model description",
+        data={"apiType": api_type},  # type: ignore
+    )
     agent = WaldiezAgent(
         id="wa-1",
         name="agent1",
         agent_type="assistant",
         description="agent description",
         data={  # type: ignore
-            "model_ids": [],
+            "model_ids": ["wm-1"],
         },
     )
     models_exporter = ModelsExporter(
-        flow_name=flow_name,
+        flow_name=FLOW_NAME,
         agents=[agent],
         agent_names=agent_names,
-        models=[model1, model2],
-        model_names=model_names,
+        models=[model],
+        model_names={"wm-1": "model1"},
         for_notebook=False,
-        output_dir=str(tmp_path),
-        cache_seed=None,
+        output_dir=None,
+        cache_seed=42,
+    )
+    generated_string = models_exporter.generate()
+    assert generated_string.startswith("\nmodel1_llm_config = {\n")
+    assert expected_snippet in generated_string
+    assert (
+        f'    "api_key": get_{FLOW_NAME}_model_api_key("model1")'
+        in generated_string
     )
-    assert models_exporter.get_imports() is not None
-    after_export = models_exporter.get_after_export()
-    assert after_export is not None
-    assert after_export[0][0] == "    llm_config=False,\n"
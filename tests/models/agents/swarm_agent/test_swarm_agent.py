@@ -88,6 +88,9 @@ def custom_update_system_message(agent, messages):
         update_system_message2,
     ]
     assert agent.nested_chats == []
+    # the (already validated) data instance is used as is, not re-validated
+    assert agent.data is agent_data
+    expected_data_dump = agent_data.model_dump()
     agent_dump = agent.model_dump()
     assert agent_dump["id"] == "wa-1"
     assert agent_dump["type"] == "agent"
@@ -96,4 +99,4 @@ def custom_update_system_message(agent, messages):
     assert agent_dump["description"] == "description"
     assert agent_dump["tags"] == []
     assert agent_dump["requirements"] == []
-    assert agent_dump["data"] == agent_data.model_dump()
+    assert agent_dump["data"] == expected_data_dump
@@ -21,6 +21,7 @@ from waldiez.models.chat.chat_nested import (
 from waldiez.models.common.method_utils import (
     MAX_VAR_NAME_LENGTH,
     check_function,
+    gather_code_imports,
     generate_function,
     get_function,
     parse_code_string,
@@ -246,6 +247,29 @@ def callable_message(sender, recipient, context):
     assert body == '    return "Hello"'
 
 
+def test_check_function_in_a_block() -> None:
+    """Test check_function with the function defined in a block."""
+    # Given
+    code_string = """
+import sys
+
+if sys.version_info >= (3, 10):
+    def callable_message(sender, recipient, context):
+        return "Hello"
+"""
+    function_name = CALLABLE_MESSAGE
+    function_args = CALLABLE_MESSAGE_ARGS
+    # When
+    valid, body = check_function(
+        code_string=code_string,
+        function_name=function_name,
+        function_args=function_args,
+    )
+    # Then
+    assert valid
+    assert body == '        return "Hello"'
+
+
 def test_generate_function() -> None:
     """Test generate_function."""
     # Given
@@ -381,3 +405,85 @@ def callable_message(sender, recipient, context):
     )
     # Then
     assert output == ""
+
+
+def test_get_decorated_and_async_function() -> None:
+    """Test get_function with decorated and async functions."""
+    # Given
+    code_string = """
+import functools
+
+@functools.cache
+def callable_message(sender, recipient, context):
+    return "Hello"
+"""
+    # When
+    output = get_function(code_string, "callable_message")
+    # Then
+    # the decorator is not included
+    assert output == (
+        "def callable_message(sender, recipient, context):\n"
+        '    return "Hello"\n'
+    )
+
+    # Given
+    code_string = (
+        "async def callable_message(sender, recipient, context):\n"
+        '    return "Hello"\n'
+    )
+    # When
+    output = get_function(code_string, "callable_message")
+    # Then
+    assert output == code_string
+
+    # Given
+    code_string = (
+        "import functools\n"
+        "\n"
+        "@functools.cache\n"
+        "async def callable_message(sender, recipient, context):\n"
+        '    return "Hello"\n'
+    )
+    # When
+    output = get_function(code_string, "callable_message")
+    # Then
+    # the decorator is not included
+    assert output == (
+        "async def callable_message(sender, recipient, context):\n"
+        '    return "Hello"\n'
+    )
+
+
+def test_gather_code_imports() -> None:
+    """Test gather_code_imports."""
+    # Given
+    code_string = (
+        "# a comment\n"
+        "import os, sys\n"
+        "import importlib\n"
+        "from typing import List\n"
+        "import requests\n"
+        "from . import local_module\n"
+        "from autogen import ConversableAgent\n"
+    )
+    # When
+    standard_lib_imports, third_party_imports = gather_code_imports(
+        code_string, is_interop=False
+    )
+    # Then
+    assert standard_lib_imports == [
+        "import importlib",
+        "import os, sys",
+        "from typing import List",
+    ]
+    assert third_party_imports == [
+        "import requests",
+        "from . import local_module",
+        "from autogen import ConversableAgent",
+    ]
+    # When
+    _, third_party_imports = gather_code_imports(code_string, is_interop=True)
+    # Then
+    assert third_party_imports[-1] == (
+        "from autogen.interop import Interoperability"
+    )
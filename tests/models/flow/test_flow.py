@@ -11,6 +11,7 @@ from waldiez.models import (
     WaldiezAgentTerminationMessage,
     WaldiezAssistant,
     WaldiezAssistantData,
+    WaldiezCaptainAgent,
     WaldiezChat,
     WaldiezChatData,
     WaldiezChatNested,
@@ -29,6 +30,8 @@ from waldiez.models import (
     WaldiezRagUserVectorDbConfig,
     WaldiezSkill,
     WaldiezSkillData,
+    WaldiezSwarmAgent,
+    WaldiezSwarmAgentData,
     WaldiezSwarmOnConditionAvailable,
     WaldiezUserProxy,
     WaldiezUserProxyData,
@@ -385,6 +388,7 @@ def test_waldiez_flow() -> None:
     assert flow1.id is not None
     assert not flow1.data.nodes
     assert flow1.get_agent_by_id("wa-1").id == "wa-1"
+    assert flow1.get_chat_agents(chats[0]) == (user, assistant)
     with pytest.raises(ValueError):
         flow1.get_agent_by_id("wa-5")
     assert not flow1.get_group_chat_members("wa-1")
@@ -394,6 +398,9 @@ def test_waldiez_flow() -> None:
     assert flow1.get_agent_connections("wa-3", False) == ["wa-2"]
     assert flow1.get_agent_connections("wa-2", False) == ["wa-1", "wa-3"]
     assert flow1.get_agent_connections("wa-1", False) == ["wa-2"]
+    connections = flow1.get_agent_connections("wa-2")
+    connections.pop()
+    assert flow1.get_agent_connections("wa-2") == ["wa-1", "wa-3"]
     assert flow1.get_group_chat_members("wa-3") == [rag_user, assistant]
 
     with pytest.raises(ValueError):
@@ -419,7 +426,7 @@ def test_waldiez_flow() -> None:
                 is_async=False,
             ),
         )
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Duplicate ID: ws-1"):
         # not unique skill IDs
         WaldiezFlow(
             id="wf-2",
@@ -443,7 +450,7 @@ def test_waldiez_flow() -> None:
             ),
         )
 
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Duplicate ID: wm-1"):
         # not unique model IDs
         WaldiezFlow(
             id="wf-3",
@@ -786,3 +793,122 @@ def test_single_agent_mode() -> None:
             updated_at="2021-01-01T00:00:00.000Z",
             data=flow_data,
         )
+
+
+def test_waldiez_flow_storage_id_default(waldiez_flow: WaldiezFlow) -> None:
+    """Test that each flow gets its own default storage ID.
+
+    Parameters
+    ----------
+    waldiez_flow : WaldiezFlow
+        A valid flow to copy the data from.
+    """
+    dumped = waldiez_flow.model_dump(by_alias=True, exclude={"storage_id"})
+    flow1 = WaldiezFlow(**dumped)
+    flow2 = WaldiezFlow(**dumped)
+    assert isinstance(flow1.storage_id, str)
+    assert isinstance(flow2.storage_id, str)
+    assert flow1.storage_id != flow2.storage_id
+
+
+def test_waldiez_flow_replaced_agent(
+    waldiez_flow_with_captain_agent: WaldiezFlow,
+) -> None:
+    """Test getting an agent that was replaced after validation.
+
+    Parameters
+    ----------
+    waldiez_flow_with_captain_agent : WaldiezFlow
+        A flow whose assistant was replaced by a captain agent.
+    """
+    flow = waldiez_flow_with_captain_agent
+    captain = flow.data.agents.captain_agents[0]
+    assert isinstance(flow.get_agent_by_id("wa-2"), WaldiezCaptainAgent)
+    chat = next(chat for chat in flow.data.chats if chat.target == "wa-2")
+    assert flow.get_chat_agents(chat)[1] is captain
+
+
+def test_swarm_chat_members_order() -> None:
+    """Test the order of the swarm chat members."""
+    user = WaldiezUserProxy(
+        id="wu-1",
+        name="user",
+        type="agent",
+        agent_type="user",
+        description="User",
+        tags=[],
+        requirements=[],
+        created_at="2021-01-01T00:00:00.000Z",
+        updated_at="2021-01-01T00:00:00.000Z",
+        data=WaldiezUserProxyData(),
+    )
+    swarm_agents = [
+        WaldiezSwarmAgent(
+            id=f"ws-{index}",
+            name=f"swarm_{index}",
+            type="agent",
+            agent_type="swarm",
+            description=f"Swarm agent {index}",
+            tags=[],
+            requirements=[],
+            created_at="2021-01-01T00:00:00.000Z",
+            updated_at="2021-01-01T00:00:00.000Z",
+            data=WaldiezSwarmAgentData(),
+        )
+        for index in range(1, 4)
+    ]
+    chats = [
+        WaldiezChat(
+            id=f"wc-{index + 1}",
+            data=WaldiezChatData(
+                name=f"chat_{index + 1}",
+                description=f"Chat {index + 1}",
+                source=source,
+                target=target,
+                position=index,
+                order=0 if index == 0 else -1,
+            ),
+        )
+        for index, (source, target) in enumerate(
+            [
+                ("wu-1", "ws-1"),
+                ("ws-1", "ws-2"),
+                ("ws-1", "ws-3"),
+                ("ws-2", "ws-1"),
+            ]
+        )
+    ]
+    flow = WaldiezFlow(
+        id="wf-1",
+        name="flow",
+        type="flow",
+        description="Flow",
+        tags=[],
+        requirements=[],
+        storage_id="flow-1",
+        created_at="2021-01-01T00:00:00.000Z",
+        updated_at="2021-01-01T00:00:00.000Z",
+        data=WaldiezFlowData(
+            nodes=[],
+            edges=[],
+            viewport={},
+            agents=WaldiezAgents(
+                users=[user],
+                assistants=[],
+                managers=[],
+                rag_users=[],
+                swarm_agents=swarm_agents,
+                reasoning_agents=[],
+                captain_agents=[],
+            ),
+            models=[],
+            skills=[],
+            chats=chats,
+            is_async=False,
+        ),
+    )
+    members, swarm_user = flow.get_swarm_chat_members(swarm_agents[0])
+    # the last connection is visited first, and "ws-2" is
+    # (also) the last connection of "ws-1" (from the last chat)
+    assert [member.id for member in members] == ["ws-1", "ws-2", "ws-3"]
+    assert swarm_user is user
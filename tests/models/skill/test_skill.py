@@ -356,6 +356,34 @@ ag2_tool = Interoperability().convert_tool(wiki_tool, type="langchain")
         )
 
 
+def test_skill_excluded_content() -> None:
+    """Test interop skill content that we do not allow."""
+    # When
+    langchain_tool_content = """
+from langchain_community.tools import WikipediaQueryRun
+from langchain_community.utilities import WikipediaAPIWrapper
+api_wrapper = WikipediaAPIWrapper(top_k_results=1, doc_content_chars_max=1000)
+wiki_tool = WikipediaQueryRun(api_wrapper=api_wrapper)
+wiki_tool.register_for_llm(description="Search wikipedia")
+"""
+    with pytest.raises(ValueError, match="register_for_llm"):
+        WaldiezSkill(
+            id="ws-1",
+            type="skill",
+            tags=[],
+            requirements=["wikipedia"],
+            name="wiki_tool",
+            created_at="2024-01-01T00:00:00Z",
+            updated_at="2024-01-01T00:00:00Z",
+            description="langchain skill",
+            data=WaldiezSkillData(
+                skill_type="langchain",
+                content=langchain_tool_content,
+                secrets={},
+            ),
+        )
+
+
 def test_custom_skill_content() -> None:
     """Test custom skill content."""
     # Given
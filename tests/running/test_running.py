@@ -2,8 +2,13 @@
 # Copyright (c) 2024 - 2025 Waldiez and contributors.
 """Test waldiez.running.running.*."""
 
+import asyncio
 import os
+import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -104,18 +109,60 @@ def test_get_printer() -> None:
     assert callable(printer)
 
 
-def test_install_requirements() -> None:
-    """Test install_requirements."""
-    extra_requirements = {"pytest"}
-    install_requirements(extra_requirements, print)
-    assert True
+@pytest.fixture(scope="session", name="pip_install_output")
+def pip_install_output_fixture() -> List[str]:
+    """Install the test requirements once per session.
+
+    Returns
+    -------
+    List[str]
+        The printed output of the installation.
+    """
+    output: List[str] = []
+    install_requirements({"pytest"}, output.append)
+    return output
+
+
+def test_install_requirements(pip_install_output: List[str]) -> None:
+    """Test install_requirements.
+
+    Parameters
+    ----------
+    pip_install_output : List[str]
+        The printed output of the installation.
+    """
+    assert pip_install_output[0] == "Installing requirements: pytest"
+    assert len(pip_install_output) > 1
 
 
 @pytest.mark.asyncio
-async def test_a_install_requirements() -> None:
-    """Test a_install_requirements."""
-    extra_requirements = {"pytest"}
-    await a_install_requirements(extra_requirements, print)
+async def test_a_install_requirements(pip_install_output: List[str]) -> None:
+    """Test a_install_requirements.
+
+    The requirements are already installed (by the session fixture),
+    so pip's process is replaced with one that replays its output.
+
+    Parameters
+    ----------
+    pip_install_output : List[str]
+        The printed output of the installation.
+    """
+    stdout = asyncio.StreamReader()
+    stdout.feed_data("\n".join(pip_install_output[1:]).encode() + b"\n")
+    stdout.feed_eof()
+    stderr = asyncio.StreamReader()
+    stderr.feed_eof()
+    output: List[str] = []
+    process = SimpleNamespace(stdout=stdout, stderr=stderr)
+    with patch(
+        "waldiez.running.running.asyncio.create_subprocess_exec",
+        new=AsyncMock(return_value=process),
+    ) as create_subprocess_exec:
+        await a_install_requirements({"pytest"}, output.append)
+    pip_install = create_subprocess_exec.call_args.args
+    assert pip_install[:4] == (sys.executable, "-m", "pip", "install")
+    assert pip_install[-1] == "pytest"
+    assert output == pip_install_output
 
 
 def test_after_run(tmp_path: Path) -> None:
@@ -175,3 +222,7 @@ def test_get_what_to_print() -> None:
 
     msg, flush = get_what_to_print("Hello, World!", sep=4, end=5, flush=True)
     assert msg == "Hello, World!\n"
+
+    msg, flush = get_what_to_print("Hello,", "World!", 42, sep="-")
+    assert msg == "Hello,-World!-42\n"
+    assert flush is False
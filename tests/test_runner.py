@@ -134,6 +134,31 @@ def test_waldiez_with_invalid_requirement(
     )
 
 
+def test_waldiez_runner_gather_requirements(waldiez_flow: WaldiezFlow) -> None:
+    """Test that only the missing requirements are gathered.
+
+    Parameters
+    ----------
+    waldiez_flow : WaldiezFlow
+        A WaldiezFlow instance.
+    """
+    flow_dict = waldiez_flow.model_dump(by_alias=True)
+    flow_dict["requirements"] = [
+        "pytest",
+        "pytest>=1.0",
+        "invalid_requirement",
+    ]
+    waldiez = Waldiez.from_dict(data=flow_dict)
+    runner = WaldiezRunner(waldiez)
+    extra_requirements = runner.gather_requirements()
+    # installed, nothing to do
+    assert "pytest" not in extra_requirements
+    # cannot tell without resolving the version, let pip handle it
+    assert "pytest>=1.0" in extra_requirements
+    # not installed
+    assert "invalid_requirement" in extra_requirements
+
+
 class BadIOStream(IOStream):
     """Bad IOStream class."""
 
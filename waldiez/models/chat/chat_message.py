@@ -105,21 +105,11 @@ class WaldiezChatMessage(WaldiezBase):
         """Get the content body."""
         return self._content_body
 
-    @model_validator(mode="after")
-    def validate_context_vars(self) -> Self:
-        """Try to detect bools nulls and numbers from the context values.
-
-        Returns
-        -------
-        WaldiezChatMessage
-            The validated instance.
-        """
-        self.context = update_dict(self.context)
-        return self
-
     @model_validator(mode="after")
     def validate_content(self) -> Self:
-        """Validate the content (if not a method).
+        """Validate the content (if not a method) and the context.
+
+        Also try to detect bools nulls and numbers from the context values.
 
         Returns
         -------
@@ -131,24 +121,22 @@ class WaldiezChatMessage(WaldiezBase):
         ValueError
             If the content is invalid.
         """
+        if self.context:
+            self.context = update_dict(self.context)
         content: Optional[str] = None
         if self.type == "none":
             content = "None"
-        if self.type == "method":
+        elif self.type == "string":
             if not self.content:
-                raise ValueError(
-                    "The message content is required for the method type"
-                )
+                self.content = ""
             content = self.content
-        if self.type == "string":
+        elif self.type == "method":
             if not self.content:
-                self.content = ""
-            if self.use_carryover:
-                content = get_last_carryover_method_content(
-                    text_content=self.content,
+                raise ValueError(
+                    "The message content is required for the method type"
                 )
             content = self.content
-        if self.type == "rag_message_generator":
+        elif self.type == "rag_message_generator":
             if self.use_carryover:
                 content = get_last_carryover_method_content(
                     text_content=self.content or "",
@@ -197,19 +185,7 @@ class WaldiezChatMessage(WaldiezBase):
         return error_or_body
 
 
-def get_last_carryover_method_content(text_content: str) -> str:
-    """Get the last carryover method content.
-
-    Parameters
-    ----------
-    text_content : str
-        Text content before the carryover.
-    Returns
-    -------
-    str
-        The last carryover method content.
-    """
-    method_content = '''
+LAST_CARRYOVER_METHOD_CONTENT = '''
     """Get the message to send using the last carryover.
 
     Parameters
@@ -236,16 +212,28 @@ def get_last_carryover_method_content(text_content: str) -> str:
             carryover = carryover.get("content", "")
     if not isinstance(carryover, str):
         carryover = ""'''
+"""The last carryover method content, before the return statement."""
+
+
+def get_last_carryover_method_content(text_content: str) -> str:
+    """Get the last carryover method content.
+
+    Parameters
+    ----------
+    text_content : str
+        Text content before the carryover.
+    Returns
+    -------
+    str
+        The last carryover method content.
+    """
     if text_content:
-        method_content += f"""
-    final_message = "{text_content}" + carryover
-    return final_message
-"""
-    else:
-        method_content += """
-    return carryover
-"""
-    return method_content
+        return (
+            f"{LAST_CARRYOVER_METHOD_CONTENT}\n"
+            f'    final_message = "{text_content}" + carryover\n'
+            "    return final_message\n"
+        )
+    return f"{LAST_CARRYOVER_METHOD_CONTENT}\n    return carryover\n"
 
 
 RAG_METHOD_WITH_CARRYOVER_BODY = '''
@@ -2,7 +2,7 @@
 # Copyright (c) 2024 - 2025 Waldiez and contributors.
 """Date utilities."""
 
-from datetime import datetime, timezone
+import time
 
 
 def now() -> str:
@@ -11,10 +11,11 @@ def now() -> str:
     Returns
     -------
     str
-        The current date and time in UTC.
+        The current date and time in UTC,
+        in ISO 8601 format with milliseconds (e.g. 2024-01-01T00:00:00.000Z).
     """
+    seconds, millis = divmod(time.time_ns() // 1_000_000, 1000)
     return (
-        datetime.now(tz=timezone.utc)
-        .isoformat(timespec="milliseconds")
-        .replace("+00:00", "Z")
+        f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}"
+        f".{millis:03d}Z"
     )
@@ -6,16 +6,20 @@ import ast
 import importlib.util
 import sys
 import sysconfig
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import parso
 import parso.python
 import parso.tree
 
 MAX_VAR_NAME_LENGTH = 64
+STDLIB_PATH = str(Path(sysconfig.get_path("stdlib")).resolve())
 
 
+@lru_cache(maxsize=2048)
 def is_standard_library(module_name: str) -> bool:
     """Check if the module is part of the standard library.
 
@@ -29,7 +33,10 @@ def is_standard_library(module_name: str) -> bool:
     bool
         True if the module is part of the standard library.
     """
-    if module_name in sys.builtin_module_names:
+    if (
+        module_name in sys.stdlib_module_names
+        or module_name in sys.builtin_module_names
+    ):
         return True
     try:
         spec = importlib.util.find_spec(module_name)
@@ -41,8 +48,58 @@ def is_standard_library(module_name: str) -> bool:
         return False
     if spec.origin.startswith(sys.prefix) or spec.origin == "frozen":
         return True
-    stdlib_path = str(Path(sysconfig.get_path("stdlib")).resolve())
-    return spec.origin.startswith(stdlib_path)
+    return spec.origin.startswith(STDLIB_PATH)
+
+
+@lru_cache(maxsize=128)
+def _ast_parse(code_string: str) -> ast.Module:
+    """Parse the code string with ast (cached, the tree is only read).
+
+    Parameters
+    ----------
+    code_string : str
+        The code string.
+
+    Returns
+    -------
+    ast.Module
+        The parsed module.
+    """
+    return ast.parse(code_string)
+
+
+@lru_cache(maxsize=128)
+def _parso_parse(code_string: str) -> parso.python.tree.Module:
+    """Parse the code string with parso (cached, the tree is only read).
+
+    Parameters
+    ----------
+    code_string : str
+        The code string.
+
+    Returns
+    -------
+    parso.python.tree.Module
+        The parsed module.
+    """
+    return parso.parse(code_string)  # type: ignore
+
+
+@lru_cache(maxsize=128)
+def _split_lines(code_string: str) -> Tuple[str, ...]:
+    """Split the code string to lines (cached, like the parsed trees).
+
+    Parameters
+    ----------
+    code_string : str
+        The code string.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        The (immutable) lines of the code string.
+    """
+    return tuple(code_string.splitlines())
 
 
 def parse_code_string(
@@ -60,10 +117,15 @@ def parse_code_string(
     Tuple[Optional[str], Optional[ast.Module]]
         If valid, None and the ast module.
         If invalid, the error message and None.
+
+    Notes
+    -----
+    The ast module is cached and shared between the calls with
+    the same code string, it must not be modified.
     """
     # pylint: disable=broad-except
     try:
-        tree = ast.parse(code_string)
+        tree = _ast_parse(code_string)
     except SyntaxError as e:
         return f"SyntaxError: {e}, in " + "\n" + f"{code_string}", None
     except BaseException as e:  # pragma: no cover
@@ -89,51 +151,90 @@ def gather_code_imports(
     Tuple[List[str], List[str]]
         The standard library imports and the third party imports.
     """
-    standard_lib_imports: List[str] = []
+    std_imports, third_party_imports = _gather_code_imports(
+        code_string, is_interop
+    )
+    # new lists, the cached ones must not be modified
+    return list(std_imports), list(third_party_imports)
+
+
+@lru_cache(maxsize=128)
+def _gather_code_imports(
+    code_string: str,
+    is_interop: bool,
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Gather the imports from the code string (cached).
+
+    Parameters
+    ----------
+    code_string : str
+        The code string.
+    is_interop : bool
+        If True, make sure the interoperability import is present.
+
+    Returns
+    -------
+    Tuple[Tuple[str, ...], Tuple[str, ...]]
+        The standard library imports and the third party imports.
+    """
+    # import x / from a import b, for the standard library and third party
+    std_imports: List[str] = []
+    std_from_imports: List[str] = []
     third_party_imports: List[str] = []
-    tree = parso.parse(code_string)  # type: ignore
-    for node in tree.iter_imports():
+    third_party_from_imports: List[str] = []
+    tree = _parso_parse(code_string)
+    for node in tree.iter_imports():  # type: ignore
+        module_name = _get_import_module_name(node)
+        if not module_name:
+            continue
+        full_import_statement = node.get_code(include_prefix=False).strip()
+        is_std = is_standard_library(module_name)
         if node.type == "import_name":
-            full_import_statement = node.get_code().strip()
-            module_name = (
-                node.get_code().replace("import", "").strip().split(" ")[0]
+            (std_imports if is_std else third_party_imports).append(
+                full_import_statement
             )
-            if not module_name:
-                continue
-            if is_standard_library(module_name):
-                standard_lib_imports.append(full_import_statement)
-            else:
-                third_party_imports.append(full_import_statement)
-        elif node.type == "import_from":
-            full_import_statement = node.get_code().strip()
-            module_name = (
-                node.get_code().replace("from", "").strip().split(" ")[0]
+        else:
+            (std_from_imports if is_std else third_party_from_imports).append(
+                full_import_statement
             )
-            if not module_name:
-                continue
-            if is_standard_library(module_name):
-                standard_lib_imports.append(full_import_statement)
-            else:
-                third_party_imports.append(full_import_statement)
-    if is_interop and (
-        "from autogen.interop import Interoperability"
-        not in third_party_imports
-    ):
-        third_party_imports.append(
-            "from autogen.interop import Interoperability"
-        )
-    # sorted_standard_lib_imports =  # first import x, then from a import b
-    sorted_standard_lib_imports = sorted(
-        [stmt for stmt in standard_lib_imports if stmt.startswith("import ")]
-    ) + sorted(
-        [stmt for stmt in standard_lib_imports if stmt.startswith("from ")]
+    interop_import = "from autogen.interop import Interoperability"
+    if is_interop and interop_import not in third_party_from_imports:
+        third_party_from_imports.append(interop_import)
+    # first import x, then from a import b
+    std_imports.sort()
+    std_from_imports.sort()
+    third_party_imports.sort()
+    third_party_from_imports.sort()
+    return (
+        (*std_imports, *std_from_imports),
+        (*third_party_imports, *third_party_from_imports),
     )
-    sorted_third_party_imports = sorted(
-        [stmt for stmt in third_party_imports if stmt.startswith("import ")]
-    ) + sorted(
-        [stmt for stmt in third_party_imports if stmt.startswith("from ")]
-    )
-    return sorted_standard_lib_imports, sorted_third_party_imports
+
+
+def _get_import_module_name(
+    node: Union[parso.python.tree.ImportName, parso.python.tree.ImportFrom],
+) -> str:
+    """Get the (top level) module name of an import statement.
+
+    Parameters
+    ----------
+    node : Union[parso.python.tree.ImportName, parso.python.tree.ImportFrom]
+        The import node.
+
+    Returns
+    -------
+    str
+        The module name, "." for relative imports,
+        or an empty string if not found.
+    """
+    if isinstance(node, parso.python.tree.ImportName):
+        paths = node.get_paths()  # type: ignore
+        return paths[0][0].value if paths and paths[0] else ""
+    if node.level > 0:
+        # relative import, never part of the standard library
+        return "."
+    from_names = node.get_from_names()  # type: ignore
+    return from_names[0].value if from_names else ""
 
 
 def check_function(
@@ -192,7 +293,9 @@ def _validate_function_body(
         If valid, True and the function body (only), no extra lines.
         If invalid, False and the error message.
     """
-    for node in ast.walk(tree):
+    # the top-level statements first, and only if the function is not
+    # one of them, the nested ones too (e.g. a def under an "if" block)
+    for node in chain(tree.body, ast.walk(tree)):
         if isinstance(node, ast.FunctionDef):
             if node.name != function_name:
                 continue
@@ -225,6 +328,7 @@ def _validate_function_body(
     return False, error_msg
 
 
+@lru_cache(maxsize=128)
 def get_function(
     code_string: str,
     function_name: str,
@@ -243,9 +347,12 @@ def get_function(
     str
         The function signature and body.
     """
-    tree = parso.parse(code_string)  # type: ignore
-    for node in tree.iter_funcdefs():
+    tree = _parso_parse(code_string)
+    for node in tree.iter_funcdefs():  # type: ignore
         if node.name.value == function_name:
+            # include the "async" keyword (it is in the def's parent)
+            if node.parent.type in ("async_funcdef", "async_stmt"):
+                return node.parent.get_code()
             return node.get_code()
     return ""
 
@@ -273,24 +380,20 @@ def _get_function_body(
     ValueError
         If no body found in the function.
     """
-    lines = code_string.splitlines()
+    lines = _split_lines(code_string)
     signature_start_line = node.lineno - 1
     body_start_line = node.body[0].lineno - 1
+    # the signature ends in the first line (before the body) with a ")"
+    signature = "\n".join(lines[signature_start_line:body_start_line])
+    signature_close = signature.find(")")
     signature_end_line = signature_start_line
-    for i in range(signature_start_line, body_start_line):
-        if ")" in lines[i]:
-            signature_end_line = i
-            break
+    if signature_close != -1:
+        signature_end_line += signature.count("\n", 0, signature_close)
     function_body_lines = lines[signature_end_line + 1 :]
     last_line = function_body_lines[-1]
     if not last_line.strip() and len(function_body_lines) > 1:
         function_body_lines = function_body_lines[:-1]
-    function_body = "\n".join(function_body_lines)
-    while function_body.startswith("\n"):
-        function_body = function_body[1:]
-    while function_body.endswith("\n"):
-        function_body = function_body[:-1]
-    return function_body
+    return "\n".join(function_body_lines).strip("\n")
 
 
 def generate_function(
@@ -322,24 +425,23 @@ def generate_function(
     """
     if len(function_name) > MAX_VAR_NAME_LENGTH:
         function_name = function_name[:MAX_VAR_NAME_LENGTH]
-    function_string = f"def {function_name}("
-    if not function_args:
-        function_string += ")"
-    else:
-        function_string += "\n"
+    parts: List[str] = [f"def {function_name}("]
+    if function_args:
+        parts.append("\n")
         for arg, arg_type in zip(function_args, function_types[0]):
             if types_as_comments:
-                function_string += f"    {arg},  # type: {arg_type}" + "\n"
+                parts.append(f"    {arg},  # type: {arg_type}\n")
             else:
-                function_string += f"    {arg}: {arg_type}," + "\n"
-        function_string += ")"
+                parts.append(f"    {arg}: {arg_type},\n")
+    parts.append(")")
     if types_as_comments:
-        function_string += ":\n"
-        function_string += "    # type: (...) -> " + function_types[1]
+        parts.append(f":\n    # type: (...) -> {function_types[1]}")
     else:
-        function_string += " -> " + function_types[1] + ":"
-    function_string += "\n" if not function_body.startswith("\n") else ""
-    function_string += f"{function_body}"
+        parts.append(f" -> {function_types[1]}:")
+    if not function_body.startswith("\n"):
+        parts.append("\n")
+    parts.append(function_body)
+    function_string = "".join(parts)
     if not function_string.endswith("\n"):
         function_string += "\n"
     return function_string
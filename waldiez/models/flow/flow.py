@@ -3,7 +3,8 @@
 """Waldiez flow model."""
 
 import uuid
-from typing import List, Optional, Tuple
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from pydantic import Field, model_validator
 from typing_extensions import Annotated, Literal, Self
@@ -14,6 +15,20 @@ from ..common import WaldiezBase, now
 from .flow_data import WaldiezFlowData
 from .utils import check_handoff_to_nested_chat, id_factory
 
+_CHAT_ORDER = attrgetter("data.order")
+_CHAT_POSITION = attrgetter("data.position")
+_USER_AGENT_TYPES = frozenset(("user", "rag_user"))
+# the WaldiezAgents fields with the flow's agents
+_AGENT_FIELDS = (
+    "users",
+    "assistants",
+    "rag_users",
+    "reasoning_agents",
+    "swarm_agents",
+    "managers",
+    "captain_agents",
+)
+
 
 class WaldiezFlow(WaldiezBase):
     """Flow data class.
@@ -101,7 +116,7 @@ class WaldiezFlow(WaldiezBase):
     storage_id: Annotated[
         str,
         Field(
-            uuid.uuid4(),
+            default_factory=lambda: str(uuid.uuid4()),
             description="The storage ID of the flow (ignored, UI related)",
             title="Storage ID",
             alias="storageId",
@@ -127,6 +142,8 @@ class WaldiezFlow(WaldiezBase):
         List[Tuple[WaldiezChat, WaldiezAgent, WaldiezAgent]]
     ] = None
     _single_agent_mode: bool = False
+    # agent id -> (agents field, position in it, agent)
+    _agent_index: Optional[Dict[str, Tuple[str, int, WaldiezAgent]]] = None
 
     @property
     def is_async(self) -> bool:
@@ -159,9 +176,8 @@ class WaldiezFlow(WaldiezBase):
         bool
             True if the flow is a swarm flow, False otherwise.
         """
-        return any(
-            agent.agent_type == "swarm" for agent in self.data.agents.members
-        )
+        # the agents are already grouped by type
+        return bool(self.data.agents.swarm_agents)
 
     @property
     def is_single_agent_mode(self) -> bool:
@@ -201,10 +217,91 @@ class WaldiezFlow(WaldiezBase):
         ValueError
             If the agent with the given ID is not found.
         """
-        for agent in self.data.agents.members:
-            if agent.id == agent_id:
+        agent_index = self._agent_index
+        entry = agent_index.get(agent_id) if agent_index else None
+        if entry is not None:
+            field, position, agent = entry
+            if self._is_indexed(agent_id, field, position, agent):
                 return agent
-        raise ValueError(f"Agent with ID {agent_id} not found.")
+        # not indexed yet, or the agents changed after indexing
+        entry = self._build_agent_index().get(agent_id)
+        if entry is None:
+            raise ValueError(f"Agent with ID {agent_id} not found.")
+        return entry[2]
+
+    def _is_indexed(
+        self, agent_id: str, field: str, position: int, agent: WaldiezAgent
+    ) -> bool:
+        """Check if an indexed agent is still at its indexed position.
+
+        Parameters
+        ----------
+        agent_id : str
+            The ID of the agent.
+        field : str
+            The agents' field (users, assistants, ...) of the agent.
+        position : int
+            The agent's position in the field's list.
+        agent : WaldiezAgent
+            The indexed agent.
+
+        Returns
+        -------
+        bool
+            True if the agent is still there (with the same ID).
+        """
+        agents: List[WaldiezAgent] = getattr(self.data.agents, field)
+        return (
+            position < len(agents)
+            and agents[position] is agent
+            and agent.id == agent_id
+        )
+
+    def get_chat_agents(
+        self, chat: WaldiezChat
+    ) -> Tuple[WaldiezAgent, WaldiezAgent]:
+        """Get the source and target agents of a chat.
+
+        Parameters
+        ----------
+        chat : WaldiezChat
+            The chat.
+
+        Returns
+        -------
+        Tuple[WaldiezAgent, WaldiezAgent]
+            The source and target agents.
+
+        Raises
+        ------
+        ValueError
+            If the source or the target agent is not found.
+        """
+        return (
+            self.get_agent_by_id(chat.source),
+            self.get_agent_by_id(chat.target),
+        )
+
+    def _reset_cache(self) -> None:
+        """Reset the values derived from the flow's data."""
+        self._ordered_flow = None
+        self._build_agent_index()
+
+    def _build_agent_index(self) -> Dict[str, Tuple[str, int, WaldiezAgent]]:
+        """Index the flow's agents by their ID.
+
+        Returns
+        -------
+        Dict[str, Tuple[str, int, WaldiezAgent]]
+            The agents' field, position and the agent by agent ID.
+        """
+        agent_index: Dict[str, Tuple[str, int, WaldiezAgent]] = {}
+        for field in _AGENT_FIELDS:
+            agents: List[WaldiezAgent] = getattr(self.data.agents, field)
+            for position, agent in enumerate(agents):
+                agent_index.setdefault(agent.id, (field, position, agent))
+        self._agent_index = agent_index
+        return agent_index
 
     def _get_flow_order(
         self,
@@ -222,14 +319,12 @@ class WaldiezFlow(WaldiezBase):
         for chat in self.data.chats:
             if chat.data.order < 0:
                 continue
-            source = self.get_agent_by_id(chat.source)
-            target = self.get_agent_by_id(chat.target)
+            source, target = self.get_chat_agents(chat)
             ordered_flow.append((chat, source, target))
         if not ordered_flow:
             if len(self.data.chats) == 1:
                 chat = self.data.chats[0]
-                source = self.get_agent_by_id(chat.source)
-                target = self.get_agent_by_id(chat.target)
+                source, target = self.get_chat_agents(chat)
                 ordered_flow.append((chat, source, target))
         return ordered_flow
 
@@ -240,51 +335,37 @@ class WaldiezFlow(WaldiezBase):
         # - source is a user|rag_user and target is a swarm
         # - source is a swarm and target is a  (and source.is_initial)
         valid_chats: List[WaldiezChat] = []
+        initial_chat: Optional[
+            Tuple[WaldiezChat, WaldiezAgent, WaldiezAgent]
+        ] = None
         for chat in self.data.chats:
-            target = self.get_agent_by_id(chat.target)
-            source = self.get_agent_by_id(chat.source)
-            if (
-                source.agent_type in ["user", "rag_user"]
-                and target.agent_type == "swarm"
-            ):
+            source, target = self.get_chat_agents(chat)
+            if target.agent_type != "swarm":
+                continue
+            if source.agent_type in _USER_AGENT_TYPES:
                 return [(chat, source, target)]
-            if source.agent_type == "swarm" and target.agent_type == "swarm":
+            if source.agent_type == "swarm":
                 valid_chats.append(chat)
+                if (
+                    initial_chat is None
+                    and isinstance(source, WaldiezSwarmAgent)
+                    and source.is_initial
+                ):
+                    initial_chat = (chat, source, target)
+        if initial_chat is not None:
+            return [initial_chat]
         if not valid_chats:
             return []
-        for valid_chat in valid_chats:
-            source = self.get_agent_by_id(valid_chat.source)
-            if isinstance(source, WaldiezSwarmAgent) and source.is_initial:
-                return [
-                    (
-                        valid_chat,
-                        source,
-                        self.get_agent_by_id(valid_chat.target),
-                    )
-                ]
-        first_chat: Optional[WaldiezChat] = None
-        # first check the order
-        by_order = sorted(
-            filter(lambda edge: edge.data.order >= 0, valid_chats),
-            key=lambda edge: edge.data.order,
+        # first check the order, then the position
+        first_chat = min(
+            (chat for chat in valid_chats if chat.data.order >= 0),
+            key=_CHAT_ORDER,
+            default=None,
         )
-        if not by_order:
-            # let's order by position
-            by_position = sorted(
-                valid_chats,
-                key=lambda chat: chat.data.position,
-            )
-            if by_position:
-                first_chat = by_position[0]
-            else:
-                first_chat = valid_chats[0]
-        else:
-            first_chat = by_order[0]
-        if first_chat:
-            source = self.get_agent_by_id(first_chat.source)
-            target = self.get_agent_by_id(first_chat.target)
-            return [(first_chat, source, target)]
-        return []
+        if first_chat is None:
+            first_chat = min(valid_chats, key=_CHAT_POSITION)
+        source, target = self.get_chat_agents(first_chat)
+        return [(first_chat, source, target)]
 
     def get_agent_connections(
         self, agent_id: str, all_chats: bool = True
@@ -302,22 +383,39 @@ class WaldiezFlow(WaldiezBase):
         Returns
         -------
         List[str]
-            The list of agent ids that the agent with the given ID connects to.
+            The list of agent ids that the agent with the given ID connects to
+            (without duplicates, in the order of the chats).
+        """
+        connections: Dict[str, None] = {}
+        for source, target in self._get_chat_endpoints(all_chats):
+            if source == agent_id:
+                connections[target] = None
+            if target == agent_id:
+                connections[source] = None
+        return list(connections)
+
+    def _get_chat_endpoints(
+        self, all_chats: bool = True
+    ) -> Iterator[Tuple[str, str]]:
+        """Get the source and target agent ids of the chats.
+
+        Parameters
+        ----------
+        all_chats : bool, optional
+            If True, get them from all the chats, otherwise
+            from the ordered flow (main chat flow).
+
+        Yields
+        ------
+        Tuple[str, str]
+            The source and target agent ids of each chat.
         """
-        connections: List[str] = []
         if all_chats:
             for chat in self.data.chats:
-                if chat.source == agent_id:
-                    connections.append(chat.target)
-                if chat.target == agent_id:
-                    connections.append(chat.source)
+                yield chat.source, chat.target
         else:
             for _, source, target in self.ordered_flow:
-                if source.id == agent_id:
-                    connections.append(target.id)
-                if target.id == agent_id:
-                    connections.append(source.id)
-        return connections
+                yield source.id, target.id
 
     def get_group_chat_members(
         self, group_manager_id: str
@@ -337,11 +435,10 @@ class WaldiezFlow(WaldiezBase):
         agent = self.get_agent_by_id(group_manager_id)
         if agent.agent_type != "manager":
             return []
-        connections = self.get_agent_connections(
-            group_manager_id,
-            all_chats=True,
-        )
-        return [self.get_agent_by_id(member_id) for member_id in connections]
+        return [
+            self.get_agent_by_id(member_id)
+            for member_id in self.get_agent_connections(group_manager_id)
+        ]
 
     def get_initial_swarm_agent(self) -> Optional[WaldiezAgent]:
         """Get the initial swarm agent.
@@ -353,8 +450,7 @@ class WaldiezFlow(WaldiezBase):
         """
         fallback_agent = None
         for chat in self.data.chats:
-            source_agent = self.get_agent_by_id(chat.source)
-            target_agent = self.get_agent_by_id(chat.target)
+            source_agent, target_agent = self.get_chat_agents(chat)
             if (
                 target_agent.agent_type == "swarm"
                 and source_agent.agent_type != "swarm"
@@ -393,10 +489,8 @@ class WaldiezFlow(WaldiezBase):
         user_agent: Optional[WaldiezAgent] = None
         visited_agents = set()
         visited_agents.add(initial_agent.id)
-        connections = self.get_agent_connections(
-            initial_agent.id,
-            all_chats=True,
-        )
+        all_connections = _get_connections(self._get_chat_endpoints())
+        connections = list(all_connections.get(initial_agent.id, ()))
         while connections:
             agent_id = connections.pop()
             if agent_id in visited_agents:
@@ -405,19 +499,18 @@ class WaldiezFlow(WaldiezBase):
             visited_agents.add(agent_id)
             if agent.agent_type == "swarm":
                 members.append(agent)
-                connections.extend(
-                    self.get_agent_connections(agent_id, all_chats=True)
-                )
+                connections.extend(all_connections.get(agent_id, ()))
             if agent.agent_type in ["user", "rag_user"] and not user_agent:
                 user_agent = agent
         return members, user_agent
 
     def _validate_agent_connections(self) -> None:
+        connected_ids = set()
+        for chat in self.data.chats:
+            connected_ids.add(chat.source)
+            connected_ids.add(chat.target)
         for agent in self.data.agents.members:
-            if not any(
-                agent.id in (chat.source, chat.target)
-                for chat in self.data.chats
-            ):
+            if agent.id not in connected_ids:
                 raise ValueError(
                     f"Agent {agent.id} ({agent.name}) "
                     "does not connect to any other node."
@@ -453,6 +546,7 @@ class WaldiezFlow(WaldiezBase):
             If the agents do not connect to any other node.
             If the manager's group chat has no members.
         """
+        self._reset_cache()
         all_members = list(self.data.agents.members)
         if len(all_members) == 1:
             return self.validate_single_agent_mode(all_members[0])
@@ -485,8 +579,11 @@ class WaldiezFlow(WaldiezBase):
             If the model IDs are not unique.
         """
         model_ids = [model.id for model in self.data.models]
-        if len(model_ids) != len(set(model_ids)):
-            raise ValueError("Model IDs must be unique.")
+        duplicate = _get_first_duplicate(model_ids)
+        if duplicate is not None:
+            raise ValueError(
+                f"Model IDs must be unique. Duplicate ID: {duplicate}"
+            )
         return model_ids
 
     def validate_flow_skills(self) -> List[str]:
@@ -503,8 +600,11 @@ class WaldiezFlow(WaldiezBase):
             If the skill IDs are not unique.
         """
         skill_ids = [skill.id for skill in self.data.skills]
-        if len(skill_ids) != len(set(skill_ids)):
-            raise ValueError("Skill IDs must be unique.")
+        duplicate = _get_first_duplicate(skill_ids)
+        if duplicate is not None:
+            raise ValueError(
+                f"Skill IDs must be unique. Duplicate ID: {duplicate}"
+            )
         return skill_ids
 
     def validate_single_agent_mode(self, member: WaldiezAgent) -> Self:
@@ -536,3 +636,49 @@ class WaldiezFlow(WaldiezBase):
         self.data.agents.validate_flow(model_ids, skills_ids)
         self._single_agent_mode = True
         return self
+
+
+def _get_first_duplicate(items: Iterable[str]) -> Optional[str]:
+    """Get the first item that appears more than once.
+
+    Parameters
+    ----------
+    items : Iterable[str]
+        The items to check.
+
+    Returns
+    -------
+    Optional[str]
+        The first duplicate item, or None if all items are unique.
+    """
+    seen = set()
+    for item in items:
+        if item in seen:
+            return item
+        seen.add(item)
+    return None
+
+
+def _get_connections(
+    edges: Iterable[Tuple[str, str]],
+) -> Dict[str, List[str]]:
+    """Get the connections of each agent.
+
+    Like in get_agent_connections, but without dropping the duplicates:
+    the swarm traversal depends on them for the order of the members.
+
+    Parameters
+    ----------
+    edges : Iterable[Tuple[str, str]]
+        The (source, target) agent ids of the chats.
+
+    Returns
+    -------
+    Dict[str, List[str]]
+        The connected agent ids (in the order of the chats) by agent id.
+    """
+    connections: Dict[str, List[str]] = {}
+    for source, target in edges:
+        connections.setdefault(source, []).append(target)
+        connections.setdefault(target, []).append(source)
+    return connections
@@ -2,8 +2,8 @@
 # Copyright (c) 2024 - 2025 Waldiez and contributors.
 """Helpers for the flow model."""
 
-import uuid
-from datetime import datetime, timezone
+import os
+import time
 from typing import Any, Dict, List, Optional
 
 from ..agents import (
@@ -24,9 +24,9 @@ def id_factory() -> str:
     str
         The unique ID.
     """
-    now_td = datetime.now(timezone.utc)
-    now_str = now_td.strftime("%Y%m%d%H%M%S%f")
-    return f"{now_str}-{uuid.uuid4().hex}"
+    seconds, micros = divmod(time.time_ns() // 1_000, 1_000_000)
+    now_str = time.strftime("%Y%m%d%H%M%S", time.gmtime(seconds))
+    return f"{now_str}{micros:06d}-{os.urandom(16).hex()}"
 
 
 def check_handoff_to_nested_chat(
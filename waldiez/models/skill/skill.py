@@ -227,11 +227,16 @@ class WaldiezSkill(WaldiezBase):
                 rf"{self.name}.register_for_llm\(",
                 rf"{self.name}.register_for_execution\(",
             ]
-            for exclude in to_exclude:
-                if re.search(exclude, self.data.content):
-                    raise ValueError(
-                        f"Invalid skill content: '{exclude}' is not allowed."
-                    )
+            # a single scan of the content, one group per exclude
+            match = re.search(
+                "|".join(f"({exclude})" for exclude in to_exclude),
+                self.data.content,
+            )
+            if match is not None and match.lastindex is not None:
+                exclude = to_exclude[match.lastindex - 1]
+                raise ValueError(
+                    f"Invalid skill content: '{exclude}' is not allowed."
+                )
 
     def _validate_custom_skill(self) -> None:
         """Validate a custom skill.
@@ -276,18 +281,22 @@ class WaldiezSkill(WaldiezBase):
         # we 'll place them at the top of the file
         all_imports = self._skill_imports[0] + self._skill_imports[1]
         code_lines = self.data.content.splitlines()
-        valid_lines = [
-            line
-            for line in code_lines
-            if not any(line.startswith(imp) for imp in all_imports)
-        ]
+        if all_imports:
+            # one pass per line, instead of one per line and import
+            import_start = re.compile("|".join(map(re.escape, all_imports)))
+            valid_lines = [
+                line for line in code_lines if not import_start.match(line)
+            ]
+        else:
+            valid_lines = code_lines
         # remove empty lines at the beginning and end
         # of the content
-        while valid_lines and not valid_lines[0].strip():
-            valid_lines.pop(0)
-        while valid_lines and not valid_lines[-1].strip():
-            valid_lines.pop()
-        self.data.content = "\n".join(valid_lines)
+        start, end = 0, len(valid_lines)
+        while start < end and not valid_lines[start].strip():
+            start += 1
+        while end > start and not valid_lines[end - 1].strip():
+            end -= 1
+        self.data.content = "\n".join(valid_lines[start:end])
         return self
 
     @property
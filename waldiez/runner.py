@@ -10,8 +10,10 @@ variables specified in the waldiez file are set.
 # pylint: disable=import-outside-toplevel,reimported
 
 import importlib.util
+import re
 import sys
 import tempfile
+from importlib.metadata import PackageNotFoundError, distribution
 from pathlib import Path
 from types import TracebackType
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, Type, Union
@@ -35,6 +37,31 @@ from .utils import check_pysqlite3
 if TYPE_CHECKING:
     from autogen import ChatResult  # type: ignore
 
+# a requirement with just a name (no extras, versions or markers)
+NAME_ONLY_REQUIREMENT = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+def _is_installed(requirement: str) -> bool:
+    """Check if a (name only) requirement is already installed.
+
+    Parameters
+    ----------
+    requirement : str
+        The requirement.
+
+    Returns
+    -------
+    bool
+        True if the requirement is just a name and it is installed.
+    """
+    if not NAME_ONLY_REQUIREMENT.match(requirement):
+        return False
+    try:
+        distribution(requirement)
+    except PackageNotFoundError:
+        return False
+    return True
+
 
 class WaldiezRunner:
     """Waldiez runner class."""
@@ -145,7 +172,9 @@ class WaldiezRunner:
             The extra requirements.
         """
         extra_requirements = set(
-            req for req in self.waldiez.requirements if req not in sys.modules
+            req
+            for req in self.waldiez.requirements
+            if req not in sys.modules and not _is_installed(req)
         )
         if self.waldiez.has_captain_agents:
             check_pysqlite3()
@@ -5,7 +5,7 @@
 import json
 import re
 from pathlib import Path
-from typing import Any, Dict, Set, Union
+from typing import Any, Dict, List, Set, Union
 
 import pandas as pd
 
@@ -79,19 +79,21 @@ def process_events(df_events: pd.DataFrame) -> str:
     participants: Set[str] = set()
     recipient: str
 
-    # Initialize the sequence diagram text
-    seq_text = SEQ_TXT
+    # The lines of the sequence diagram (after the participants)
+    seq_lines: List[str] = []
 
     # Loop through each event in the DataFrame
-    for i in range(len(df_events["json_state"])):
+    for json_state, event_name, source_name in zip(
+        df_events["json_state"],
+        df_events["event_name"],
+        df_events["source_name"],
+    ):
         # Parse the JSON state of the event
-        df_j = get_json_state(df_events["json_state"][i])
+        df_j = get_json_state(json_state)
         # Skip events that are not relevant (e.g., replies or missing messages)
-        if ("message" in df_j.keys()) and (
-            df_events["event_name"][i] != "reply_func_executed"
-        ):
+        if ("message" in df_j.keys()) and (event_name != "reply_func_executed"):
             sender = df_j["sender"]
-            recipient = df_events["source_name"][i]
+            recipient = source_name
 
             # Extract message content if available
             if (
@@ -116,21 +118,21 @@ def process_events(df_events: pd.DataFrame) -> str:
                 message_parts = message.split("Content: ")
                 main_message = message_parts[0].strip()
                 context = "Content: " + message_parts[1].strip()
-                seq_text += f"    {sender}->>{recipient}: {main_message}\n"
-                seq_text += f"    note over {recipient}: {context}\n"
+                seq_lines.append(
+                    f"    {sender}->>{recipient}: {main_message}\n"
+                )
+                seq_lines.append(f"    note over {recipient}: {context}\n")
             else:
-                seq_text += f"    {sender}->>{recipient}: {message}\n"
+                seq_lines.append(f"    {sender}->>{recipient}: {message}\n")
 
     # Add participants to the Mermaid diagram
-    participants_text = ""
-    for participant in participants:
-        participant_title = participant.replace("_", " ").title()
-        participants_text += (
-            f"    participant {participant} as {participant_title}" + "\n"
-        )
+    participants_lines = [
+        f"    participant {participant} as "
+        f"{participant.replace('_', ' ').title()}\n"
+        for participant in participants
+    ]
     # Prepend the participants to the sequence diagram text
-    mermaid_text = SEQ_TXT + participants_text + seq_text[len(SEQ_TXT) :]
-    return mermaid_text
+    return "".join([SEQ_TXT, *participants_lines, *seq_lines])
 
 
 def save_diagram(mermaid_text: str, output_path: Union[str, Path]) -> None:
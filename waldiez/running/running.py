@@ -339,6 +339,10 @@ def get_what_to_print(*args: object, **kwargs: object) -> Tuple[str, bool]:
     flush = kwargs.get("flush", False)
     if not isinstance(flush, bool):
         flush = False
-    msg = sep.join(str(arg) for arg in args) + end
+    if len(args) == 1 and isinstance(args[0], str):
+        # the usual case: a single string, nothing to join
+        msg = args[0] + end
+    else:
+        msg = sep.join(str(arg) for arg in args) + end
     utf8_msg = msg.encode("utf-8", errors="replace").decode("utf-8")
     return utf8_msg, flush